@@ -6,6 +6,12 @@ from models.game_state import GameState
 from models.move import Move
 from models.piece import PieceType, Color
 from engine.chess_engine import ChessEngine
+from engine.attack_tables import KING_ATTACKS
+
+
+# Material values ordered to match Board's bitboard layout
+# (pawn, knight, bishop, rook, queen, king)
+_BB_PIECE_VALUES = (1, 3, 3, 5, 9, 0)
 
 
 class AIOpponent:
@@ -28,82 +34,303 @@ class AIOpponent:
         PieceType.KING: 0  # King has no material value (can't be captured)
     }
     
-    def __init__(self, engine: ChessEngine, time_limit: float = 5.0):
+    # Score assigned to being checkmated; well outside any material swing
+    MATE_SCORE = 100000
+
+    # Transposition-table entry flags: whether the stored value is
+    # exact, a lower bound (search failed high), or an upper bound
+    # (search failed low)
+    TT_EXACT = 0
+    TT_LOWER = 1
+    TT_UPPER = 2
+
+    # Centipawn values used only for move ordering: captures are tried
+    # most-valuable-victim first, least-valuable-attacker breaking ties
+    ORDER_VALUES = {
+        PieceType.PAWN: 100,
+        PieceType.KNIGHT: 320,
+        PieceType.BISHOP: 330,
+        PieceType.ROOK: 500,
+        PieceType.QUEEN: 900,
+        PieceType.KING: 20000
+    }
+
+    def __init__(self, engine: ChessEngine, time_limit: float = 5.0, max_depth: int = 2):
         """
         Initialize the AI opponent.
-        
+
         Args:
             engine: Chess engine for move generation and validation
             time_limit: Maximum time in seconds for move selection
+            max_depth: Maximum search depth in plies for move selection
         """
         self.engine = engine
         self.time_limit = time_limit
-    
+        self.max_depth = max_depth
+        self._deadline = 0.0
+        self._timed_out = False
+        # Two killer-move slots per remaining depth, refreshed each
+        # select_move call; quiet moves that caused a beta cutoff get
+        # tried early at sibling nodes of the same depth
+        self._killers = []
+        # Transposition table: position hash -> (depth, value, flag,
+        # best_move). Positions reached through different move orders
+        # hash identically, so a revisit answers from the table instead
+        # of re-searching the subtree. Cleared per select_move call but
+        # shared across iterative-deepening passes, where the previous
+        # pass's best move seeds the next pass's ordering.
+        self._tt = {}
+
     def select_move(self, state: GameState) -> Optional[Move]:
         """
         Choose the best move for the current position.
-        
+
         Strategy:
         1. Check for checkmate in one move - if found, play it
-        2. Evaluate all legal moves
-        3. Avoid moves that lose material without compensation
-        4. Select the move with the best evaluation
-        
+        2. Search the move tree with alpha-beta pruning, deepening one
+           ply at a time so a timeout still returns the best move from
+           the last completed depth
+        3. Select the move with the best evaluation
+
         Args:
             state: Current game state
-        
+
         Returns:
             Selected move, or None if no legal moves available
-        
+
         Requirements: 5.1, 5.2, 5.4
         """
-        start_time = time.time()
-        
+        self._deadline = time.time() + self.time_limit
+        self._timed_out = False
+
         # Get all legal moves (Requirement 5.2)
         legal_moves = self.engine.get_legal_moves(state, state.current_player)
-        
+
         # No legal moves available
         if not legal_moves:
             return None
-        
+
         # Check for checkmate in one move (Requirement 5.5)
         checkmate_move = self.find_checkmate_in_one(state, legal_moves)
         if checkmate_move is not None:
             return checkmate_move
-        
-        # Check time limit
-        if time.time() - start_time > self.time_limit:
-            # Return first legal move if time runs out
-            return legal_moves[0]
-        
-        # Evaluate all moves and select the best one
-        best_move = None
-        best_score = float('-inf')
-        
-        for move in legal_moves:
-            # Check time limit
-            if time.time() - start_time > self.time_limit:
+
+        # Iterative deepening: each completed depth replaces the best
+        # move, so running out of time mid-depth still leaves a move
+        # chosen by a full, shallower search
+        best_move = legal_moves[0]
+        self._killers = [[] for _ in range(self.max_depth + 1)]
+        self._tt = {}
+
+        for depth in range(1, self.max_depth + 1):
+            candidate = None
+            candidate_score = float('-inf')
+            alpha = float('-inf')
+            beta = float('inf')
+
+            for move in self._order_moves(legal_moves, depth):
+                new_state = self.engine.execute_move(state, move)
+                score = self._alphabeta(new_state, depth - 1, alpha, beta, False)
+                if self._timed_out:
+                    break
+                # Strict comparison: equal-score moves keep the earlier
+                # one, so the root breaks ties deterministically
+                if score > candidate_score:
+                    candidate_score = score
+                    candidate = move
+                if candidate_score > alpha:
+                    alpha = candidate_score
+
+            if self._timed_out:
                 break
-            
-            # Execute move to get resulting position
-            new_state = self.engine.execute_move(state, move)
-            
-            # Evaluate the position from AI's perspective
-            score = self.evaluate_position(new_state)
-            
-            # Prefer moves that don't lose material (Requirement 5.4)
-            # Check if this move loses material without compensation
-            if move.captured_piece is None and self._is_hanging(new_state, move.to_square):
-                # Penalize moves that leave pieces hanging
-                score -= self.PIECE_VALUES[move.piece.piece_type] * 0.9
-            
-            if score > best_score:
-                best_score = score
-                best_move = move
-        
-        # Return best move found, or first legal move if evaluation incomplete
-        return best_move if best_move is not None else legal_moves[0]
-    
+            if candidate is not None:
+                best_move = candidate
+
+        return best_move
+
+    def _alphabeta(self, state: GameState, depth: int, alpha: float, beta: float,
+                   maximizing: bool) -> float:
+        """
+        Alpha-beta search of the move tree below a position.
+
+        Scores are always from the AI's point of view: maximizing nodes
+        are the AI to move, minimizing nodes the opponent. Branches that
+        cannot affect the root choice are cut off when the running best
+        meets the opposing bound.
+
+        Args:
+            state: Position to search
+            depth: Remaining depth in plies; 0 evaluates statically
+            alpha: Best score the maximizing side is assured of so far
+            beta: Best score the minimizing side is assured of so far
+            maximizing: True if the side to move is the AI
+
+        Returns:
+            Evaluation of the position (higher favors the AI)
+        """
+        if time.time() > self._deadline:
+            self._timed_out = True
+            return 0.0
+
+        if depth == 0:
+            # evaluate_position scores for the side to move; flip at
+            # minimizing nodes so the score stays from the AI's view
+            score = self.evaluate_position(state)
+            return score if maximizing else -score
+
+        # Bind the per-child call targets to locals once per node: the
+        # loops below resolve them thousands of times in a deep search,
+        # and a local load is the cheapest lookup CPython has
+        execute_move = self.engine.execute_move
+        alphabeta = self._alphabeta
+
+        # Probe the transposition table: an entry searched at least this
+        # deep can answer outright (exact value) or tighten the window
+        # (bound values); a shallower entry still donates its best move
+        # to the front of the ordering
+        key = state.compute_position_hash()
+        entry = self._tt.get(key)
+        tt_move = None
+        if entry is not None:
+            if entry[0] >= depth:
+                value = entry[1]
+                flag = entry[2]
+                if flag == self.TT_EXACT:
+                    return value
+                if flag == self.TT_LOWER:
+                    if value > alpha:
+                        alpha = value
+                elif value < beta:
+                    beta = value
+                if alpha >= beta:
+                    return value
+            tt_move = entry[3]
+
+        legal_moves = self.engine.get_legal_moves(state, state.current_player)
+
+        if not legal_moves:
+            if self.engine.check_detector.is_check(state, state.current_player):
+                # Checkmate: bad for whoever is to move. Prefer faster
+                # mates by scoring those found higher in the tree larger
+                mate = self.MATE_SCORE + depth
+                return -mate if maximizing else mate
+            return 0.0  # Stalemate
+
+        ordered_moves = self._order_moves(legal_moves, depth, tt_move)
+
+        # Window the node was searched with, kept for classifying the
+        # stored value as exact or a bound
+        alpha_in = alpha
+        beta_in = beta
+        node_best_move = None
+
+        if maximizing:
+            best = float('-inf')
+            for move in ordered_moves:
+                new_state = execute_move(state, move)
+                score = alphabeta(new_state, depth - 1, alpha, beta, False)
+                if self._timed_out:
+                    return best
+                if score > best:
+                    best = score
+                    node_best_move = move
+                if best > alpha:
+                    alpha = best
+                if best >= beta:
+                    # Opponent would never allow this line
+                    self._record_killer(move, depth)
+                    break
+        else:
+            best = float('inf')
+            for move in ordered_moves:
+                new_state = execute_move(state, move)
+                score = alphabeta(new_state, depth - 1, alpha, beta, True)
+                if self._timed_out:
+                    return best
+                if score < best:
+                    best = score
+                    node_best_move = move
+                if best < beta:
+                    beta = best
+                if best <= alpha:
+                    # The AI would never allow this line
+                    self._record_killer(move, depth)
+                    break
+
+        self._store_tt(key, depth, best, alpha_in, beta_in, node_best_move)
+        return best
+
+    def _store_tt(self, key: int, depth: int, value: float, alpha: float,
+                  beta: float, best_move: Optional[Move]) -> None:
+        """
+        Record a search result in the transposition table.
+
+        Args:
+            key: Position hash the node was searched under
+            depth: Depth the node was searched to
+            value: Score the search returned
+            alpha: Lower edge of the window the node was searched with
+            beta: Upper edge of the window the node was searched with
+            best_move: Move that produced the score, if any
+        """
+        if value <= alpha:
+            flag = self.TT_UPPER   # Failed low: true value is at most this
+        elif value >= beta:
+            flag = self.TT_LOWER   # Failed high: true value is at least this
+        else:
+            flag = self.TT_EXACT
+        self._tt[key] = (depth, value, flag, best_move)
+
+    def _order_moves(self, moves: list[Move], depth: int,
+                     tt_move: Optional[Move] = None) -> list[Move]:
+        """
+        Sort moves so the likely-best ones are searched first.
+
+        The transposition-table move (if any) leads, captures follow
+        scored most-valuable-victim / least-valuable-attacker, then
+        killer moves for this depth, then quiet moves in generated
+        order. Good ordering is what lets alpha-beta cut off early
+        instead of degenerating to full minimax.
+
+        Args:
+            moves: Legal moves to order
+            depth: Remaining search depth (selects the killer slots)
+            tt_move: Best move from a previous search of this position
+
+        Returns:
+            New list of the same moves, best candidates first
+        """
+        killers = self._killers[depth]
+        values = self.ORDER_VALUES
+
+        def order_score(move: Move) -> int:
+            if move == tt_move:
+                return 1000000  # Above any capture score
+            captured = move.captured_piece
+            if captured is not None:
+                return 10 * values[captured.piece_type] - values[move.piece.piece_type]
+            if move in killers:
+                return 1
+            return 0
+
+        return sorted(moves, key=order_score, reverse=True)
+
+    def _record_killer(self, move: Move, depth: int) -> None:
+        """
+        Remember a quiet move that caused a beta cutoff.
+
+        Args:
+            move: Move that refuted the line
+            depth: Remaining depth at the node where the cutoff happened
+        """
+        if move.captured_piece is not None:
+            return  # Captures are already ordered first
+        killers = self._killers[depth]
+        if move in killers:
+            return
+        killers.insert(0, move)
+        del killers[2:]
+
     def evaluate_position(self, state: GameState) -> float:
         """
         Assign a numeric score to a position based on material count.
@@ -118,24 +345,22 @@ class AIOpponent:
         
         Requirement 5.3: Consider material value of pieces
         """
-        # Get pieces for both colors
-        current_pieces = state.board.get_all_pieces(state.current_player)
-        opponent_pieces = state.board.get_all_pieces(state.current_player.opposite())
-        
-        # Calculate material count for current player
-        current_material = sum(
-            self.PIECE_VALUES[piece.piece_type]
-            for piece in current_pieces.values()
+        # Popcount each piece bitboard instead of scanning squares.
+        # bb[type_index * 2] holds white pieces, bb[type_index * 2 + 1] black.
+        bb = state.board.bb
+        white_material = sum(
+            value * bb[type_index * 2].bit_count()
+            for type_index, value in enumerate(_BB_PIECE_VALUES)
         )
-        
-        # Calculate material count for opponent
-        opponent_material = sum(
-            self.PIECE_VALUES[piece.piece_type]
-            for piece in opponent_pieces.values()
+        black_material = sum(
+            value * bb[type_index * 2 + 1].bit_count()
+            for type_index, value in enumerate(_BB_PIECE_VALUES)
         )
-        
+
         # Return material advantage (positive means AI is ahead)
-        return current_material - opponent_material
+        if state.current_player == Color.WHITE:
+            return white_material - black_material
+        return black_material - white_material
     
     def find_checkmate_in_one(self, state: GameState, legal_moves: list[Move]) -> Optional[Move]:
         """
@@ -150,41 +375,36 @@ class AIOpponent:
         
         Requirement 5.5: Execute checkmate in one move when available
         """
+        check_detector = self.engine.check_detector
+
         for move in legal_moves:
             # Execute the move
             new_state = self.engine.execute_move(state, move)
-            
-            # Check if this results in checkmate
+
+            # Cheap bitboard pre-filter before the full checkmate test.
+            # A move can only be mate if the enemy king is attacked and
+            # has no safe adjacent square. The attack map is computed
+            # with the defending king removed from the occupancy so that
+            # squares behind the king along a checking ray still count
+            # as attacked (the king cannot retreat along the ray).
+            board = new_state.board
+            defender = new_state.current_player
+            king_bb = board.bb[10 if defender == Color.WHITE else 11]
+            if king_bb:
+                king_index = king_bb.bit_length() - 1
+                attacks = check_detector.attacks_bitboard(
+                    board, move.piece.color, board.occ_all & ~king_bb
+                )
+                if not (attacks >> king_index) & 1:
+                    continue  # Doesn't even give check
+                own_occupancy = (
+                    board.occ_white if defender == Color.WHITE else board.occ_black
+                )
+                if KING_ATTACKS[king_index] & ~own_occupancy & ~attacks:
+                    continue  # King has a safe escape square
+
+            # Full test (handles blocks and captures of the checker)
             if self.engine.is_checkmate(new_state):
                 return move
-        
+
         return None
-    
-    def _is_hanging(self, state: GameState, square) -> bool:
-        """
-        Check if a piece at a given square is hanging (undefended and attackable).
-        
-        This is a simple heuristic to avoid leaving pieces undefended.
-        
-        Args:
-            state: Game state after a move
-            square: Square to check
-        
-        Returns:
-            True if the piece appears to be hanging
-        """
-        piece = state.board.get_piece(square)
-        if piece is None:
-            return False
-        
-        # Get all legal moves for the opponent
-        opponent_moves = self.engine.get_legal_moves(state, state.current_player)
-        
-        # Check if any opponent move can capture this piece
-        for move in opponent_moves:
-            if move.to_square == square and move.captured_piece is not None:
-                # The piece can be captured
-                # Simple heuristic: it's hanging if it can be captured
-                return True
-        
-        return False
@@ -0,0 +1,24 @@
+"""Shared pytest fixtures for the chess game test suite."""
+
+import pytest
+
+from engine.chess_engine import ChessEngine
+from ai.ai_opponent import AIOpponent
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Single ChessEngine shared across the whole test run.
+
+    The engine is stateless apart from its position-keyed caches, so
+    constructing it (and paying any table-initialization cost) once per
+    session is safe.
+    """
+    return ChessEngine()
+
+
+@pytest.fixture(scope="session")
+def ai(engine):
+    """AI opponent bound to the session-scoped engine."""
+    return AIOpponent(engine)
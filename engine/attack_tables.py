@@ -0,0 +1,198 @@
+"""Precomputed attack bitboard tables for non-sliding pieces.
+
+The tables are built once at import time: for every square 0-63 they hold
+a 64-bit bitboard of the squares a knight or king attacks from there.
+Move generation then reduces to one table lookup plus bitwise masking
+instead of iterating offsets with per-square bounds checks.
+"""
+
+from typing import List
+
+_KNIGHT_DELTAS = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2)
+)
+
+_KING_DELTAS = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+)
+
+
+def _build_table(deltas) -> List[int]:
+    """
+    Build a 64-entry attack table for a fixed set of (file, rank) deltas.
+
+    Args:
+        deltas: Iterable of (file_offset, rank_offset) pairs
+
+    Returns:
+        List of 64 attack bitboards indexed by square (rank * 8 + file)
+    """
+    table = []
+    for rank in range(8):
+        for file in range(8):
+            attacks = 0
+            for file_offset, rank_offset in deltas:
+                target_file = file + file_offset
+                target_rank = rank + rank_offset
+                if 0 <= target_file <= 7 and 0 <= target_rank <= 7:
+                    attacks |= 1 << (target_rank * 8 + target_file)
+            table.append(attacks)
+    return table
+
+
+KNIGHT_ATTACKS: List[int] = _build_table(_KNIGHT_DELTAS)
+KING_ATTACKS: List[int] = _build_table(_KING_DELTAS)
+
+# Pawn attack tables, one per color: the squares a pawn of that color
+# attacks from each square. Attackers of a square are found with the
+# opposite color's table, e.g. white pawns attacking square s are
+# PAWN_ATTACKS_BLACK[s] & white_pawns.
+PAWN_ATTACKS_WHITE: List[int] = _build_table(((-1, 1), (1, 1)))
+PAWN_ATTACKS_BLACK: List[int] = _build_table(((-1, -1), (1, -1)))
+
+
+# File masks used to keep pawn-attack shifts from wrapping around the
+# board edges, and the 64-bit truncation mask for shifted bitboards
+FILE_A = sum(1 << (rank * 8) for rank in range(8))
+FILE_H = sum(1 << (rank * 8 + 7) for rank in range(8))
+BOARD_MASK = (1 << 64) - 1
+
+
+# Sliding-piece attacks via Hyperbola Quintessence. For each square the
+# four line masks (rank, file, diagonal, anti-diagonal, each excluding
+# the square itself) are precomputed; the o ^ (o - 2r) trick then yields
+# the blocker-truncated attacks along a line with a few 64-bit
+# arithmetic ops, using a full bit reversal for the negative direction.
+
+def _build_line_mask(square_index: int, file_dir: int, rank_dir: int) -> int:
+    """
+    Build the two-sided line mask through a square for one direction pair.
+
+    Args:
+        square_index: Square the line passes through (rank * 8 + file)
+        file_dir: File step of the positive direction (-1, 0, or 1)
+        rank_dir: Rank step of the positive direction (-1, 0, or 1)
+
+    Returns:
+        Bitboard of the full line, excluding the square itself
+    """
+    mask = 0
+    for sign in (1, -1):
+        file = square_index % 8 + file_dir * sign
+        rank = square_index // 8 + rank_dir * sign
+        while 0 <= file <= 7 and 0 <= rank <= 7:
+            mask |= 1 << (rank * 8 + file)
+            file += file_dir * sign
+            rank += rank_dir * sign
+    return mask
+
+
+RANK_MASKS: List[int] = [_build_line_mask(index, 1, 0) for index in range(64)]
+FILE_MASKS: List[int] = [_build_line_mask(index, 0, 1) for index in range(64)]
+DIAG_MASKS: List[int] = [_build_line_mask(index, 1, 1) for index in range(64)]
+ANTI_DIAG_MASKS: List[int] = [_build_line_mask(index, -1, 1) for index in range(64)]
+
+# Per-byte bit-reversal lookup; _reverse_64 combines eight table hits
+_BYTE_REVERSE = tuple(
+    int(f"{byte:08b}"[::-1], 2) for byte in range(256)
+)
+
+
+def _reverse_64(value: int) -> int:
+    """Reverse the bit order of a 64-bit integer."""
+    return (
+        (_BYTE_REVERSE[value & 0xFF] << 56) |
+        (_BYTE_REVERSE[(value >> 8) & 0xFF] << 48) |
+        (_BYTE_REVERSE[(value >> 16) & 0xFF] << 40) |
+        (_BYTE_REVERSE[(value >> 24) & 0xFF] << 32) |
+        (_BYTE_REVERSE[(value >> 32) & 0xFF] << 24) |
+        (_BYTE_REVERSE[(value >> 40) & 0xFF] << 16) |
+        (_BYTE_REVERSE[(value >> 48) & 0xFF] << 8) |
+        _BYTE_REVERSE[(value >> 56) & 0xFF]
+    )
+
+
+def _line_attacks(square_bit: int, occupancy: int, mask: int) -> int:
+    """
+    Hyperbola Quintessence attacks along one masked line.
+
+    Subtracting twice the slider bit from the masked occupancy clears
+    everything up to and including the first blocker in the positive
+    direction; doing the same on the bit-reversed board covers the
+    negative direction, and the XOR of the two keeps exactly the
+    attacked squares.
+
+    Args:
+        square_bit: Single-bit bitboard of the slider's square
+        occupancy: Bitboard of all occupied squares
+        mask: Line mask through the slider's square
+
+    Returns:
+        Bitboard of attacked squares along the line
+    """
+    forward = occupancy & mask
+    reverse = _reverse_64(forward)
+    forward = (forward - 2 * square_bit) & BOARD_MASK
+    reverse = (reverse - 2 * _reverse_64(square_bit)) & BOARD_MASK
+    return (forward ^ _reverse_64(reverse)) & mask
+
+
+def rook_attacks(square_index: int, occupancy: int) -> int:
+    """Bitboard of rook attacks from a square given board occupancy."""
+    square_bit = 1 << square_index
+    return (
+        _line_attacks(square_bit, occupancy, RANK_MASKS[square_index]) |
+        _line_attacks(square_bit, occupancy, FILE_MASKS[square_index])
+    )
+
+
+def bishop_attacks(square_index: int, occupancy: int) -> int:
+    """Bitboard of bishop attacks from a square given board occupancy."""
+    square_bit = 1 << square_index
+    return (
+        _line_attacks(square_bit, occupancy, DIAG_MASKS[square_index]) |
+        _line_attacks(square_bit, occupancy, ANTI_DIAG_MASKS[square_index])
+    )
+
+
+def queen_attacks(square_index: int, occupancy: int) -> int:
+    """Bitboard of queen attacks from a square given board occupancy."""
+    return rook_attacks(square_index, occupancy) | bishop_attacks(square_index, occupancy)
+
+
+def _build_between_table():
+    """
+    Build the 64x64 table of squares strictly between two squares.
+
+    BETWEEN[a][b] has a bit set for every square on the straight or
+    diagonal line from a to b, excluding both endpoints; it is 0 when
+    the squares do not share a rank, file or diagonal. Used to turn
+    "can this move block the check?" and "is this piece pinned along
+    the ray?" into single AND operations.
+
+    Returns:
+        Tuple of 64 tuples of 64 bitboards
+    """
+    table = [[0] * 64 for _ in range(64)]
+    for start in range(64):
+        start_file = start & 7
+        start_rank = start >> 3
+        for file_dir, rank_dir in (
+            (1, 0), (-1, 0), (0, 1), (0, -1),
+            (1, 1), (1, -1), (-1, 1), (-1, -1)
+        ):
+            mask = 0
+            file = start_file + file_dir
+            rank = start_rank + rank_dir
+            while 0 <= file <= 7 and 0 <= rank <= 7:
+                end = rank * 8 + file
+                table[start][end] = mask
+                mask |= 1 << end
+                file += file_dir
+                rank += rank_dir
+    return tuple(tuple(row) for row in table)
+
+
+BETWEEN = _build_between_table()
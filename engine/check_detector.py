@@ -1,9 +1,14 @@
 """Check detection for chess positions."""
 
 from typing import Optional
+from models.board import Board
 from models.game_state import GameState
 from models.square import Square
-from models.piece import Piece, PieceType, Color
+from models.piece import Color
+from engine.attack_tables import (
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS_WHITE, PAWN_ATTACKS_BLACK,
+    rook_attacks, bishop_attacks, FILE_A, FILE_H, BOARD_MASK
+)
 
 
 class CheckDetector:
@@ -27,14 +32,73 @@ class CheckDetector:
         Returns:
             Square where the king is located, or None if not found
         """
-        for rank in range(8):
-            for file in range(8):
-                square = Square(file, rank)
-                piece = state.board.get_piece(square)
-                if piece is not None and piece.piece_type == PieceType.KING and piece.color == color:
-                    return square
-        return None
+        # The king bitboard lives at bb[10] (white) / bb[11] (black);
+        # it holds at most one bit, so bit_length alone locates it
+        king_bb = state.board.bb[10 if color == Color.WHITE else 11]
+        if not king_bb:
+            return None
+        index = king_bb.bit_length() - 1
+        return Square(index % 8, index // 8)
     
+    def attacks_bitboard(self, board: Board, color: Color, occupancy: Optional[int] = None) -> int:
+        """
+        Compute a bitboard of every square attacked by one side.
+
+        Pawn attacks are produced for all pawns at once with two masked
+        shifts; knights and the king come from the precomputed attack
+        tables; sliders use the ray-lookup helpers against the given
+        occupancy.
+
+        Args:
+            board: Board to analyze
+            color: Color of the attacking side
+            occupancy: Occupancy bitboard to slide against (defaults to
+                board.occ_all; pass a modified occupancy to see through
+                a piece, e.g. the defending king for escape-square tests)
+
+        Returns:
+            Bitboard with a bit set for every attacked square
+        """
+        if occupancy is None:
+            occupancy = board.occ_all
+        bb = board.bb
+        color_offset = 0 if color == Color.WHITE else 1
+
+        # Pawns: shift the whole pawn bitboard diagonally, masking off
+        # the edge files so attacks don't wrap to the other side
+        pawns = bb[color_offset]
+        if color == Color.WHITE:
+            attacks = (((pawns & ~FILE_A) << 7) | ((pawns & ~FILE_H) << 9)) & BOARD_MASK
+        else:
+            attacks = ((pawns & ~FILE_A) >> 9) | ((pawns & ~FILE_H) >> 7)
+
+        knights = bb[2 + color_offset]
+        while knights:
+            attacks |= KNIGHT_ATTACKS[(knights & -knights).bit_length() - 1]
+            knights &= knights - 1
+
+        bishops = bb[4 + color_offset]
+        while bishops:
+            attacks |= bishop_attacks((bishops & -bishops).bit_length() - 1, occupancy)
+            bishops &= bishops - 1
+
+        rooks = bb[6 + color_offset]
+        while rooks:
+            attacks |= rook_attacks((rooks & -rooks).bit_length() - 1, occupancy)
+            rooks &= rooks - 1
+
+        queens = bb[8 + color_offset]
+        while queens:
+            index = (queens & -queens).bit_length() - 1
+            attacks |= bishop_attacks(index, occupancy) | rook_attacks(index, occupancy)
+            queens &= queens - 1
+
+        king = bb[10 + color_offset]
+        if king:
+            attacks |= KING_ATTACKS[king.bit_length() - 1]
+
+        return attacks
+
     def is_square_attacked(self, state: GameState, square: Square, by_color: Color) -> bool:
         """
         Determine if a square is under attack by a given color.
@@ -51,159 +115,27 @@ class CheckDetector:
         Returns:
             True if the square is under attack by the given color
         """
-        # Check all pieces of the attacking color
-        pieces = state.board.get_all_pieces(by_color)
-        
-        for piece_square, piece in pieces.items():
-            if self._can_piece_attack_square(state, piece_square, piece, square):
-                return True
-        
-        return False
-    
-    def _can_piece_attack_square(
-        self,
-        state: GameState,
-        from_square: Square,
-        piece: Piece,
-        target_square: Square
-    ) -> bool:
-        """
-        Check if a piece can attack a specific square.
-        
-        Args:
-            state: Current game state
-            from_square: Square where the attacking piece is located
-            piece: The attacking piece
-            target_square: Square to check if it can be attacked
-        
-        Returns:
-            True if the piece can attack the target square
-        """
-        if piece.piece_type == PieceType.PAWN:
-            return self._can_pawn_attack(from_square, piece, target_square)
-        elif piece.piece_type == PieceType.KNIGHT:
-            return self._can_knight_attack(from_square, target_square)
-        elif piece.piece_type == PieceType.BISHOP:
-            return self._can_bishop_attack(state, from_square, target_square)
-        elif piece.piece_type == PieceType.ROOK:
-            return self._can_rook_attack(state, from_square, target_square)
-        elif piece.piece_type == PieceType.QUEEN:
-            return self._can_queen_attack(state, from_square, target_square)
-        elif piece.piece_type == PieceType.KING:
-            return self._can_king_attack(from_square, target_square)
-        
-        return False
-    
-    def _can_pawn_attack(self, from_square: Square, piece: Piece, target_square: Square) -> bool:
-        """
-        Check if a pawn can attack a target square.
-        
-        Pawns attack diagonally forward one square.
-        """
-        direction = 1 if piece.color == Color.WHITE else -1
-        
-        # Check if target is one rank forward and one file to the side
-        rank_diff = target_square.rank - from_square.rank
-        file_diff = abs(target_square.file - from_square.file)
-        
-        return rank_diff == direction and file_diff == 1
-    
-    def _can_knight_attack(self, from_square: Square, target_square: Square) -> bool:
-        """
-        Check if a knight can attack a target square.
-        
-        Knights move in an L-shape: 2 squares in one direction, 1 square perpendicular.
-        """
-        file_diff = abs(target_square.file - from_square.file)
-        rank_diff = abs(target_square.rank - from_square.rank)
-        
-        return (file_diff == 2 and rank_diff == 1) or (file_diff == 1 and rank_diff == 2)
-    
-    def _can_bishop_attack(self, state: GameState, from_square: Square, target_square: Square) -> bool:
-        """
-        Check if a bishop can attack a target square.
-        
-        Bishops move diagonally, and the path must be clear.
-        """
-        file_diff = target_square.file - from_square.file
-        rank_diff = target_square.rank - from_square.rank
-        
-        # Must be on a diagonal
-        if abs(file_diff) != abs(rank_diff) or file_diff == 0:
-            return False
-        
-        # Check if path is clear
-        return self._is_path_clear(state, from_square, target_square)
-    
-    def _can_rook_attack(self, state: GameState, from_square: Square, target_square: Square) -> bool:
-        """
-        Check if a rook can attack a target square.
-        
-        Rooks move horizontally or vertically, and the path must be clear.
-        """
-        file_diff = target_square.file - from_square.file
-        rank_diff = target_square.rank - from_square.rank
-        
-        # Must be on same file or same rank (but not both)
-        if not ((file_diff == 0 and rank_diff != 0) or (file_diff != 0 and rank_diff == 0)):
-            return False
-        
-        # Check if path is clear
-        return self._is_path_clear(state, from_square, target_square)
-    
-    def _can_queen_attack(self, state: GameState, from_square: Square, target_square: Square) -> bool:
-        """
-        Check if a queen can attack a target square.
-        
-        Queens move like both bishops and rooks.
-        """
-        return (self._can_bishop_attack(state, from_square, target_square) or
-                self._can_rook_attack(state, from_square, target_square))
-    
-    def _can_king_attack(self, from_square: Square, target_square: Square) -> bool:
-        """
-        Check if a king can attack a target square.
-        
-        Kings move one square in any direction.
-        """
-        file_diff = abs(target_square.file - from_square.file)
-        rank_diff = abs(target_square.rank - from_square.rank)
-        
-        return file_diff <= 1 and rank_diff <= 1 and (file_diff != 0 or rank_diff != 0)
-    
-    def _is_path_clear(self, state: GameState, from_square: Square, to_square: Square) -> bool:
+        return self._attacked(state.board, square.rank * 8 + square.file, by_color)
+
+    def _attacked(self, board: Board, index: int, by_color: Color) -> bool:
         """
-        Check if the path between two squares is clear (no pieces in between).
-        
+        Bitboard attack test for a square index.
+
+        Thin method wrapper around the module-level _square_attacked,
+        which carries the hot path.
+
         Args:
-            state: Current game state
-            from_square: Starting square
-            to_square: Ending square
-        
+            board: Board to test against
+            index: Target square as rank * 8 + file
+            by_color: Color of the attacking side
+
         Returns:
-            True if all squares between from_square and to_square are empty
+            True if any piece of by_color attacks the square
         """
-        file_diff = to_square.file - from_square.file
-        rank_diff = to_square.rank - from_square.rank
-        
-        # Determine direction
-        file_step = 0 if file_diff == 0 else (1 if file_diff > 0 else -1)
-        rank_step = 0 if rank_diff == 0 else (1 if rank_diff > 0 else -1)
-        
-        # Check each square along the path (excluding start and end)
-        current_file = from_square.file + file_step
-        current_rank = from_square.rank + rank_step
-        
-        while current_file != to_square.file or current_rank != to_square.rank:
-            square = Square(current_file, current_rank)
-            if state.board.get_piece(square) is not None:
-                return False
-            
-            current_file += file_step
-            current_rank += rank_step
-        
-        return True
-    
+        return _square_attacked(
+            board.bb, board.occ_all, index, 0 if by_color == Color.WHITE else 1
+        )
+
     def is_check(self, state: GameState, color: Color) -> bool:
         """
         Determine if the king of the given color is in check.
@@ -217,12 +149,61 @@ class CheckDetector:
         Returns:
             True if the king is in check
         """
-        king_square = self.find_king_position(state, color)
-        
+        # Take the king index straight off its bitboard; no Square needed
+        king_bb = state.board.bb[10 if color == Color.WHITE else 11]
+
         # If king not found, cannot be in check (shouldn't happen in valid game)
-        if king_square is None:
+        if not king_bb:
             return False
-        
+
         # Check if the king's square is under attack by the opponent
-        opponent_color = color.opposite()
-        return self.is_square_attacked(state, king_square, opponent_color)
+        return self._attacked(state.board, king_bb.bit_length() - 1, color.opposite())
+
+
+def _square_attacked(
+    bb,
+    occupancy: int,
+    index: int,
+    color_offset: int,
+    _pawn_tables=(PAWN_ATTACKS_BLACK, PAWN_ATTACKS_WHITE),
+    _knight=KNIGHT_ATTACKS,
+    _king=KING_ATTACKS,
+    _bishop=bishop_attacks,
+    _rook=rook_attacks
+) -> bool:
+    """
+    Hot-path attack test over raw bitboards and ints.
+
+    Looks outward from the target square: pawns, knights and kings are
+    one table-AND each, and the sliding attacks from the target
+    intersected with the matching piece bitboards cover bishops, rooks
+    and queens. Kept as a module-level function with the tables bound as
+    default arguments so every lookup inside is a local load — the
+    closest CPython gets to compiling the integer kernel.
+
+    Args:
+        bb: The board's 12 piece bitboards
+        occupancy: Bitboard of all occupied squares
+        index: Target square as rank * 8 + file
+        color_offset: 0 for a white attacker, 1 for black
+
+    Returns:
+        True if any piece of the attacking color attacks the square
+    """
+    # A pawn of the attacking color attacks the target exactly when a
+    # pawn of the opposite color standing on the target would attack it
+    if _pawn_tables[color_offset][index] & bb[color_offset]:
+        return True
+
+    if _knight[index] & bb[2 + color_offset]:
+        return True
+
+    if _king[index] & bb[10 + color_offset]:
+        return True
+
+    diagonal_sliders = bb[4 + color_offset] | bb[8 + color_offset]
+    if diagonal_sliders and _bishop(index, occupancy) & diagonal_sliders:
+        return True
+
+    straight_sliders = bb[6 + color_offset] | bb[8 + color_offset]
+    return bool(straight_sliders and _rook(index, occupancy) & straight_sliders)
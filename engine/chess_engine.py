@@ -8,6 +8,9 @@ from models.piece import Piece, PieceType, Color
 from engine.move_generator import MoveGenerator
 from engine.move_validator import MoveValidator
 from engine.check_detector import CheckDetector
+from engine.attack_tables import (
+    KNIGHT_ATTACKS, rook_attacks, bishop_attacks, queen_attacks
+)
 
 
 class ChessEngine:
@@ -23,6 +26,9 @@ class ChessEngine:
         self.move_generator = MoveGenerator()
         self.move_validator = MoveValidator()
         self.check_detector = CheckDetector()
+        # Checkmate results cached by Zobrist position hash; repeated
+        # positions reached during search/validation skip regeneration
+        self._checkmate_cache = {}
     
     def initialize_game(self, mode: GameMode) -> GameState:
         """
@@ -79,19 +85,15 @@ class ChessEngine:
             # Normal move or capture
             self._execute_normal_move(new_state, move)
         
-        # Update castling rights when king or rook moves (Requirement 7.4)
-        new_state.castling_rights.revoke_for_piece(
-            move.piece.piece_type,
-            move.piece.color,
-            move.from_square
+        # Update castling rights: one masked AND covers a king or rook
+        # leaving its start square and a rook being captured on one
+        # (Requirements 7.4, 7.5)
+        new_state.castling_rights.revoke_for_move(
+            move.from_square.index, move.to_square.index
         )
-        
-        # Update castling rights when rook is captured (Requirement 7.5)
-        if move.captured_piece is not None and move.captured_piece.piece_type == PieceType.ROOK:
-            new_state.castling_rights.revoke_for_rook_capture(move.to_square)
-        
+
         # Update en passant target square (Requirement 7.2)
-        new_state.en_passant_target = self._calculate_en_passant_target(move)
+        new_state.en_passant_index = self._calculate_en_passant_index(move)
         
         # Update halfmove clock (Requirement 7.2, 7.3)
         # Reset on pawn move or capture, otherwise increment
@@ -111,7 +113,7 @@ class ChessEngine:
         new_state.current_player = state.current_player.opposite()
         
         # Add position to position history (for threefold repetition)
-        new_state.position_history.append(new_state.compute_position_hash())
+        new_state.record_position(new_state.compute_position_hash())
         
         return new_state
     
@@ -175,36 +177,32 @@ class ChessEngine:
         captured_pawn_square = Square(move.to_square.file, move.from_square.rank)
         state.board.remove_piece(captured_pawn_square)
     
-    def _calculate_en_passant_target(self, move: Move) -> Optional[Square]:
+    def _calculate_en_passant_index(self, move: Move) -> int:
         """
-        Calculate the en passant target square after a move.
-        
+        Calculate the en passant target square index after a move.
+
         En passant is available when a pawn moves two squares forward.
-        The target square is the square the pawn passed through.
-        
+        The target square is the square the pawn passed through —
+        halfway between the from and to indices, regardless of color.
+
         Args:
             move: Move that was just executed
-        
+
         Returns:
-            En passant target square, or None if not applicable
-        
+            En passant target square index, or -1 if not applicable
+
         Requirement 7.2: Enable en passant capture for opponent's next move only
         """
-        # Only pawns moving two squares forward create en passant opportunities
+        # Only pawns moving two squares forward create en passant
+        # opportunities; a double push is exactly 16 index steps
         if move.piece.piece_type != PieceType.PAWN:
-            return None
-        
-        rank_diff = abs(move.to_square.rank - move.from_square.rank)
-        if rank_diff != 2:
-            return None
-        
-        # The en passant target is the square the pawn passed through
-        if move.piece.color == Color.WHITE:
-            # White pawn moved from rank 1 to rank 3, target is rank 2
-            return Square(move.from_square.file, move.from_square.rank + 1)
-        else:
-            # Black pawn moved from rank 6 to rank 4, target is rank 5
-            return Square(move.from_square.file, move.from_square.rank - 1)
+            return -1
+
+        from_index = move.from_square.index
+        to_index = move.to_square.index
+        if to_index - from_index in (16, -16):
+            return (from_index + to_index) >> 1
+        return -1
     
     def get_legal_moves(self, state: GameState, color: Color) -> list[Move]:
         """
@@ -219,17 +217,57 @@ class ChessEngine:
         
         Requirements: 2.1
         """
+        # Consult the state's per-color cache first. Checkmate/stalemate
+        # detection, notation disambiguation and the AI all re-request
+        # the same move list for the same position; the cache turns the
+        # repeat queries into a dict lookup. The key captures everything
+        # legality depends on, so in-place edits to the board, castling
+        # rights or en passant target invalidate stale entries.
+        cache_key = self.position_key(state)
+        cached = state._legal_cache.get(color)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
         # Generate pseudo-legal moves
         pseudo_legal_moves = self.move_generator.generate_pseudo_legal_moves(state, color)
-        
-        # Filter to only legal moves (those that don't leave king in check)
+
+        # Filter to only legal moves (those that don't leave king in
+        # check), testing each against pin/check info computed once for
+        # the whole position
+        context = self.move_validator.compute_check_context(state, color)
         legal_moves = []
         for move in pseudo_legal_moves:
-            if self.move_validator.is_legal_move(state, move):
+            if self.move_validator.is_legal_in_context(state, move, context):
                 legal_moves.append(move)
-        
+
+        # The frozenset rides along for O(1) membership tests in
+        # is_legal_move / get_legal_moves_set (Move hashes on its
+        # packed int, so building it is cheap)
+        state._legal_cache[color] = (cache_key, legal_moves, frozenset(legal_moves))
         return legal_moves
-    
+
+    @staticmethod
+    def position_key(state: GameState) -> Tuple[int, int, int]:
+        """
+        Build a hashable key identifying the position for move legality.
+
+        Two states with the same key have the same legal moves, so the
+        key doubles as the validity stamp for the legal-move cache and
+        lets callers (e.g. the game controller's selection cache) tag
+        derived data with the position it was computed for.
+
+        Args:
+            state: Game state to key
+
+        Returns:
+            Tuple of board hash, castling bits and en passant index
+        """
+        return (
+            state.board.zobrist,
+            state.castling_rights.bits if state.castling_rights is not None else -1,
+            state.en_passant_index
+        )
+
     def is_legal_move(self, state: GameState, move: Move) -> bool:
         """
         Check if a specific move is legal in the current game state.
@@ -240,11 +278,84 @@ class ChessEngine:
         
         Returns:
             True if the move is legal
-        
+
         Requirements: 2.3, 2.4
         """
+        # Always answer by membership in the full legal-move set, so
+        # the verdict is identical on cold and warm caches (the
+        # validator fallback used to accept hand-built moves that break
+        # the piece's movement pattern, which set membership rejects).
+        # The set is cached per position, so repeat queries stay O(1).
+        return move in self.get_legal_moves_set(state, move.piece.color)
+
+    def is_legal(self, state: GameState, move: Move) -> bool:
+        """
+        Check whether an arbitrary move is legal, without generating all moves.
+
+        Unlike is_legal_move, which assumes the move came out of the move
+        generator, this also verifies the move follows the moving piece's
+        movement pattern, so it accepts moves constructed by hand. Only
+        the moves of the one piece are generated, not the whole side's.
+
+        Args:
+            state: Current game state
+            move: Move to test
+
+        Returns:
+            True if the move is legal
+        """
+        candidates = self.move_generator.generate_piece_moves(state, move.from_square)
+        if move not in candidates:
+            return False
         return self.move_validator.is_legal_move(state, move)
-    
+
+    def get_legal_moves_set(self, state: GameState, color: Color) -> frozenset:
+        """
+        Get all legal moves for a color as a frozenset.
+
+        Move hashes on its packed integer, so membership tests against
+        the returned set are O(1) instead of a scan of the move list.
+
+        Args:
+            state: Current game state
+            color: Color to get legal moves for
+
+        Returns:
+            Frozenset of all legal moves
+        """
+        self.get_legal_moves(state, color)
+        return state._legal_cache[color][2]
+
+    def has_any_legal_move(self, state: GameState) -> bool:
+        """
+        Check whether the current player has at least one legal move.
+
+        Unlike get_legal_moves, this stops at the first legal move
+        found, generating candidates one piece at a time — in typical
+        positions the very first piece examined settles the question.
+        Used by checkmate/stalemate detection, which only needs
+        existence, not the full list.
+
+        Args:
+            state: Current game state
+
+        Returns:
+            True if any legal move exists for the current player
+        """
+        color = state.current_player
+
+        # If the full list is already cached for this position, use it
+        cached = state._legal_cache.get(color)
+        if cached is not None and cached[0] == self.position_key(state):
+            return bool(cached[1])
+
+        context = self.move_validator.compute_check_context(state, color)
+        for square in state.board.get_all_pieces(color):
+            for move in self.move_generator.generate_piece_moves(state, square):
+                if self.move_validator.is_legal_in_context(state, move, context):
+                    return True
+        return False
+
     def is_checkmate(self, state: GameState) -> bool:
         """
         Determine if the current player is in checkmate.
@@ -261,13 +372,20 @@ class ChessEngine:
         
         Requirement 4.1: Detect checkmate (in check with no legal moves)
         """
-        # Must be in check for checkmate
-        if not self.check_detector.is_check(state, state.current_player):
-            return False
+        position_hash = state.compute_position_hash()
+        cached = self._checkmate_cache.get(position_hash)
+        if cached is not None:
+            return cached
         
-        # Check if there are any legal moves
-        legal_moves = self.get_legal_moves(state, state.current_player)
-        return len(legal_moves) == 0
+        # Must be in check for checkmate; then it suffices to know
+        # whether any escape exists, not what all of them are
+        if not self.check_detector.is_check(state, state.current_player):
+            result = False
+        else:
+            result = not self.has_any_legal_move(state)
+
+        self._checkmate_cache[position_hash] = result
+        return result
     
     def is_stalemate(self, state: GameState) -> bool:
         """
@@ -288,10 +406,9 @@ class ChessEngine:
         # Must NOT be in check for stalemate
         if self.check_detector.is_check(state, state.current_player):
             return False
-        
-        # Check if there are any legal moves
-        legal_moves = self.get_legal_moves(state, state.current_player)
-        return len(legal_moves) == 0
+
+        # Check whether any legal move exists (first hit short-circuits)
+        return not self.has_any_legal_move(state)
     
     def is_threefold_repetition(self, state: GameState) -> bool:
         """
@@ -313,13 +430,10 @@ class ChessEngine:
         """
         if len(state.position_history) < 3:
             return False
-        
-        current_position_hash = state.compute_position_hash()
-        
-        # Count how many times this position has occurred
-        count = state.position_history.count(current_position_hash)
-        
-        return count >= 3
+
+        # The state keeps an occurrence count per hash, so this is a
+        # dict lookup rather than a scan of the whole history
+        return state.repetition_counts.get(state.compute_position_hash(), 0) >= 3
     
     def is_fifty_move_rule(self, state: GameState) -> bool:
         """
@@ -348,6 +462,10 @@ class ChessEngine:
         - King + Knight vs King
         - King + Bishop vs King + Bishop (same color bishops)
         
+        The classification runs entirely on the piece bitboards: a few
+        ORs and popcounts instead of enumerating pieces and counting by
+        type.
+        
         Args:
             state: Current game state
         
@@ -356,116 +474,54 @@ class ChessEngine:
         
         Requirement 4.5: Detect insufficient material
         """
-        white_pieces = state.board.get_all_pieces(Color.WHITE)
-        black_pieces = state.board.get_all_pieces(Color.BLACK)
-        
-        # Count pieces by type for each color
-        white_counts = self._count_pieces_by_type(white_pieces)
-        black_counts = self._count_pieces_by_type(black_pieces)
-        
-        # King vs King
-        if (white_counts['total'] == 1 and black_counts['total'] == 1):
-            return True
-        
-        # King + Bishop vs King
-        if (white_counts['total'] == 2 and white_counts[PieceType.BISHOP] == 1 and
-            black_counts['total'] == 1):
-            return True
-        
-        if (black_counts['total'] == 2 and black_counts[PieceType.BISHOP] == 1 and
-            white_counts['total'] == 1):
-            return True
-        
-        # King + Knight vs King
-        if (white_counts['total'] == 2 and white_counts[PieceType.KNIGHT] == 1 and
-            black_counts['total'] == 1):
-            return True
-        
-        if (black_counts['total'] == 2 and black_counts[PieceType.KNIGHT] == 1 and
-            white_counts['total'] == 1):
+        bb = state.board.bb
+
+        # Any pawn, rook or queen is always sufficient material
+        if bb[0] | bb[1] | bb[6] | bb[7] | bb[8] | bb[9]:
+            return False
+
+        white_minors = bb[2] | bb[4]
+        black_minors = bb[3] | bb[5]
+        minor_count = white_minors.bit_count() + black_minors.bit_count()
+
+        # King vs king, or one lone minor piece against a bare king
+        if minor_count <= 1:
             return True
-        
-        # King + Bishop vs King + Bishop (same color bishops)
-        if (white_counts['total'] == 2 and white_counts[PieceType.BISHOP] == 1 and
-            black_counts['total'] == 2 and black_counts[PieceType.BISHOP] == 1):
-            # Check if bishops are on same color squares
-            white_bishop_square = self._find_piece_square(white_pieces, PieceType.BISHOP)
-            black_bishop_square = self._find_piece_square(black_pieces, PieceType.BISHOP)
-            
-            if white_bishop_square and black_bishop_square:
-                # Bishops are on same color if sum of coordinates has same parity
-                white_square_color = (white_bishop_square.file + white_bishop_square.rank) % 2
-                black_square_color = (black_bishop_square.file + black_bishop_square.rank) % 2
-                
-                if white_square_color == black_square_color:
-                    return True
-        
+
+        # King + bishop on each side, with both bishops on squares of
+        # the same color
+        if (minor_count == 2 and not (bb[2] | bb[3]) and
+                white_minors.bit_count() == 1):
+            return bool(bb[4] & _LIGHT_SQUARES) == bool(bb[5] & _LIGHT_SQUARES)
+
         return False
     
-    def _count_pieces_by_type(self, pieces: dict) -> dict:
-        """
-        Count pieces by type.
-        
-        Args:
-            pieces: Dictionary mapping squares to pieces
-        
-        Returns:
-            Dictionary with counts for each piece type and total count
-        """
-        counts = {
-            PieceType.PAWN: 0,
-            PieceType.KNIGHT: 0,
-            PieceType.BISHOP: 0,
-            PieceType.ROOK: 0,
-            PieceType.QUEEN: 0,
-            PieceType.KING: 0,
-            'total': 0
-        }
-        
-        for piece in pieces.values():
-            counts[piece.piece_type] += 1
-            counts['total'] += 1
-        
-        return counts
-    
-    def _find_piece_square(self, pieces: dict, piece_type: PieceType) -> Optional[Square]:
-        """
-        Find the square of a specific piece type.
-        
-        Args:
-            pieces: Dictionary mapping squares to pieces
-            piece_type: Type of piece to find
-        
-        Returns:
-            Square where the piece is located, or None if not found
-        """
-        for square, piece in pieces.items():
-            if piece.piece_type == piece_type:
-                return square
-        return None
-    
     def is_draw(self, state: GameState) -> bool:
         """
         Check if the game is a draw by any condition.
         
         Draw conditions:
-        - Stalemate
-        - Threefold repetition
         - Fifty-move rule
         - Insufficient material
-        
+        - Threefold repetition
+        - Stalemate
+
         Args:
             state: Current game state
-        
+
         Returns:
             True if any draw condition is met
-        
+
         Requirements: 4.2, 4.3, 4.4, 4.5
         """
-        return (self.is_stalemate(state) or
+        # Cheapest predicates first: the clock comparison, popcount
+        # material test and repetition dict lookup all short-circuit
+        # before stalemate, the only condition that needs legal-move
+        # generation
+        return (self.is_fifty_move_rule(state) or
+                self.is_insufficient_material(state) or
                 self.is_threefold_repetition(state) or
-                self.is_fifty_move_rule(state) or
-                self.is_insufficient_material(state))
+                self.is_stalemate(state))
     
     def get_algebraic_notation(self, state: GameState, move: Move) -> str:
         """
@@ -528,41 +584,60 @@ class ChessEngine:
         # Castling never needs disambiguation
         if move.is_castling:
             return (False, False)
-        
-        # Get all legal moves for the current player
-        all_legal_moves = self.get_legal_moves(state, state.current_player)
-        
-        # Find other pieces of the same type that can move to the same square
-        same_destination_moves = []
-        for other_move in all_legal_moves:
-            if (other_move.piece.piece_type == move.piece.piece_type and
-                other_move.to_square == move.to_square and
-                other_move.from_square != move.from_square):
-                same_destination_moves.append(other_move)
-        
-        # No disambiguation needed if no other pieces can move there
-        if not same_destination_moves:
+
+        # Find same-type pieces attacking the destination with a single
+        # attack-from-target lookup intersected against the side's piece
+        # bitboard, instead of scanning the whole legal move list. For
+        # almost every move this resolves to an empty bitboard.
+        piece = move.piece
+        board = state.board
+        to_index = move.to_square.rank * 8 + move.to_square.file
+        from_index = move.from_square.rank * 8 + move.from_square.file
+        color_offset = 0 if piece.color == Color.WHITE else 1
+
+        if piece.piece_type == PieceType.KNIGHT:
+            attackers = KNIGHT_ATTACKS[to_index] & board.bb[2 + color_offset]
+        elif piece.piece_type == PieceType.BISHOP:
+            attackers = bishop_attacks(to_index, board.occ_all) & board.bb[4 + color_offset]
+        elif piece.piece_type == PieceType.ROOK:
+            attackers = rook_attacks(to_index, board.occ_all) & board.bb[6 + color_offset]
+        else:  # Queen
+            attackers = queen_attacks(to_index, board.occ_all) & board.bb[8 + color_offset]
+
+        attackers &= ~(1 << from_index)
+        if not attackers:
             return (False, False)
-        
+
+        # An attacker only forces disambiguation if its move is actually
+        # legal (a pinned rival piece is excluded, matching SAN rules)
+        captured = board.get_piece(move.to_square)
+        rivals = []
+        while attackers:
+            index = (attackers & -attackers).bit_length() - 1
+            attackers &= attackers - 1
+            rival_move = Move(
+                Square(index % 8, index // 8), move.to_square, piece,
+                captured_piece=captured
+            )
+            if not self.move_validator.would_leave_in_check(state, rival_move):
+                rivals.append(index)
+
+        if not rivals:
+            return (False, False)
+
         # Check if file disambiguation is sufficient
-        file_unique = True
-        for other_move in same_destination_moves:
-            if other_move.from_square.file == move.from_square.file:
-                file_unique = False
-                break
-        
-        if file_unique:
+        from_file = from_index % 8
+        if all(index % 8 != from_file for index in rivals):
             return (True, False)
-        
+
         # Check if rank disambiguation is sufficient
-        rank_unique = True
-        for other_move in same_destination_moves:
-            if other_move.from_square.rank == move.from_square.rank:
-                rank_unique = False
-                break
-        
-        if rank_unique:
+        from_rank = from_index // 8
+        if all(index // 8 != from_rank for index in rivals):
             return (False, True)
-        
+
         # Need both file and rank for full disambiguation
         return (True, True)
+
+# Bitboard of the light squares (file + rank odd), used for the
+# same-colored-bishops insufficient-material test
+_LIGHT_SQUARES = 0x55AA55AA55AA55AA
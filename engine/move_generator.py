@@ -5,6 +5,10 @@ from models.game_state import GameState
 from models.move import Move
 from models.square import Square
 from models.piece import Piece, PieceType, Color
+from engine.attack_tables import (
+    KNIGHT_ATTACKS, KING_ATTACKS,
+    rook_attacks, bishop_attacks, queen_attacks
+)
 
 
 class MoveGenerator:
@@ -49,21 +53,10 @@ class MoveGenerator:
         if piece is None:
             return []
         
-        # Dispatch to piece-specific generation method
-        if piece.piece_type == PieceType.PAWN:
-            return self._generate_pawn_moves(state, square, piece)
-        elif piece.piece_type == PieceType.KNIGHT:
-            return self._generate_knight_moves(state, square, piece)
-        elif piece.piece_type == PieceType.BISHOP:
-            return self._generate_bishop_moves(state, square, piece)
-        elif piece.piece_type == PieceType.ROOK:
-            return self._generate_rook_moves(state, square, piece)
-        elif piece.piece_type == PieceType.QUEEN:
-            return self._generate_queen_moves(state, square, piece)
-        elif piece.piece_type == PieceType.KING:
-            return self._generate_king_moves(state, square, piece)
-        
-        return []
+        # Dispatch to the piece-specific generation method through the
+        # table at the bottom of the class: one dict lookup instead of
+        # walking an if/elif ladder over piece types
+        return self._GENERATORS[piece.piece_type](self, state, square, piece)
     
     def _generate_pawn_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
         """
@@ -161,31 +154,23 @@ class MoveGenerator:
         Knights move in an L-shape: 2 squares in one direction, 1 square perpendicular.
         """
         moves = []
-        
-        # All possible knight move offsets
-        knight_offsets = [
-            (2, 1), (2, -1), (-2, 1), (-2, -1),
-            (1, 2), (1, -2), (-1, 2), (-1, -2)
-        ]
-        
-        for file_offset, rank_offset in knight_offsets:
-            target_file = square.file + file_offset
-            target_rank = square.rank + rank_offset
-            
-            # Check if target is within board bounds
-            if 0 <= target_file <= 7 and 0 <= target_rank <= 7:
-                target_square = Square(target_file, target_rank)
-                target_piece = state.board.get_piece(target_square)
-                
-                # Can move to empty square or capture opponent's piece
-                if target_piece is None or target_piece.color != piece.color:
-                    moves.append(Move(
-                        from_square=square,
-                        to_square=target_square,
-                        piece=piece,
-                        captured_piece=target_piece
-                    ))
-        
+        board = state.board
+        grid = board.grid
+        own_occ = board.occ_white if piece.color == Color.WHITE else board.occ_black
+
+        # Precomputed attack bitboard, masked against own pieces
+        targets = KNIGHT_ATTACKS[square.rank * 8 + square.file] & ~own_occ
+        while targets:
+            index = (targets & -targets).bit_length() - 1
+            targets &= targets - 1
+            target_file, target_rank = index % 8, index // 8
+            moves.append(Move(
+                from_square=square,
+                to_square=Square(target_file, target_rank),
+                piece=piece,
+                captured_piece=grid[target_rank][target_file]
+            ))
+
         return moves
     
     def _generate_bishop_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
@@ -194,15 +179,9 @@ class MoveGenerator:
         
         Bishops move diagonally any number of squares.
         """
-        moves = []
-        
-        # Four diagonal directions
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        
-        for file_dir, rank_dir in directions:
-            moves.extend(self._generate_sliding_moves(state, square, piece, file_dir, rank_dir))
-        
-        return moves
+        board = state.board
+        attacks = bishop_attacks(square.rank * 8 + square.file, board.occ_all)
+        return self._moves_from_attack_bitboard(board, square, piece, attacks)
     
     def _generate_rook_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
         """
@@ -210,15 +189,9 @@ class MoveGenerator:
         
         Rooks move horizontally or vertically any number of squares.
         """
-        moves = []
-        
-        # Four orthogonal directions
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        
-        for file_dir, rank_dir in directions:
-            moves.extend(self._generate_sliding_moves(state, square, piece, file_dir, rank_dir))
-        
-        return moves
+        board = state.board
+        attacks = rook_attacks(square.rank * 8 + square.file, board.occ_all)
+        return self._moves_from_attack_bitboard(board, square, piece, attacks)
     
     def _generate_queen_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
         """
@@ -226,18 +199,9 @@ class MoveGenerator:
         
         Queens move like both bishops and rooks (diagonally and orthogonally).
         """
-        moves = []
-        
-        # All eight directions (diagonal + orthogonal)
-        directions = [
-            (1, 0), (-1, 0), (0, 1), (0, -1),  # Orthogonal
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal
-        ]
-        
-        for file_dir, rank_dir in directions:
-            moves.extend(self._generate_sliding_moves(state, square, piece, file_dir, rank_dir))
-        
-        return moves
+        board = state.board
+        attacks = queen_attacks(square.rank * 8 + square.file, board.occ_all)
+        return self._moves_from_attack_bitboard(board, square, piece, attacks)
 
     def _generate_king_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
         """
@@ -248,32 +212,26 @@ class MoveGenerator:
         - Castle kingside or queenside (if conditions are met)
         """
         moves = []
-        
-        # One square in any direction
-        directions = [
-            (1, 0), (-1, 0), (0, 1), (0, -1),  # Orthogonal
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Diagonal
-        ]
-        
-        for file_dir, rank_dir in directions:
-            target_file = square.file + file_dir
-            target_rank = square.rank + rank_dir
-            if 0 <= target_file <= 7 and 0 <= target_rank <= 7:
-                target_square = Square(target_file, target_rank)
-                target_piece = state.board.get_piece(target_square)
-                
-                # Can move to empty square or capture opponent's piece
-                if target_piece is None or target_piece.color != piece.color:
-                    moves.append(Move(
-                        from_square=square,
-                        to_square=target_square,
-                        piece=piece,
-                        captured_piece=target_piece
-                    ))
-        
+        board = state.board
+        grid = board.grid
+        own_occ = board.occ_white if piece.color == Color.WHITE else board.occ_black
+
+        # Precomputed attack bitboard, masked against own pieces
+        targets = KING_ATTACKS[square.rank * 8 + square.file] & ~own_occ
+        while targets:
+            index = (targets & -targets).bit_length() - 1
+            targets &= targets - 1
+            target_file, target_rank = index % 8, index // 8
+            moves.append(Move(
+                from_square=square,
+                to_square=Square(target_file, target_rank),
+                piece=piece,
+                captured_piece=grid[target_rank][target_file]
+            ))
+
         # Castling
         moves.extend(self._generate_castling_moves(state, square, piece))
-        
+
         return moves
     
     def _generate_castling_moves(self, state: GameState, square: Square, piece: Piece) -> List[Move]:
@@ -361,65 +319,38 @@ class MoveGenerator:
         
         return moves
     
-    def _generate_sliding_moves(
-        self,
-        state: GameState,
-        square: Square,
-        piece: Piece,
-        file_dir: int,
-        rank_dir: int
-    ) -> List[Move]:
+    def _moves_from_attack_bitboard(self, board, square: Square, piece: Piece, attacks: int) -> List[Move]:
         """
-        Generate moves for sliding pieces (bishop, rook, queen) in one direction.
-        
+        Build Move objects from a precomputed attack bitboard.
+
+        Squares occupied by the moving side are masked off; remaining set
+        bits become quiet moves or captures depending on occupancy.
+
         Args:
-            state: Current game state
+            board: Board holding the position
             square: Starting square
             piece: Piece being moved
-            file_dir: Direction to move in file (-1, 0, or 1)
-            rank_dir: Direction to move in rank (-1, 0, or 1)
-        
+            attacks: Bitboard of attacked squares
+
         Returns:
-            List of moves in the given direction
+            List of pseudo-legal moves for the piece
         """
         moves = []
-        current_file = square.file + file_dir
-        current_rank = square.rank + rank_dir
-        
-        while True:
-            # Stop if we've gone off the board
-            if not (0 <= current_file <= 7 and 0 <= current_rank <= 7):
-                break
-            
-            target_square = Square(current_file, current_rank)
-            
-            target_piece = state.board.get_piece(target_square)
-            
-            if target_piece is None:
-                # Empty square - can move here and continue
-                moves.append(Move(
-                    from_square=square,
-                    to_square=target_square,
-                    piece=piece
-                ))
-            elif target_piece.color != piece.color:
-                # Opponent's piece - can capture but can't continue
-                moves.append(Move(
-                    from_square=square,
-                    to_square=target_square,
-                    piece=piece,
-                    captured_piece=target_piece
-                ))
-                break
-            else:
-                # Own piece - can't move here
-                break
-            
-            current_file += file_dir
-            current_rank += rank_dir
-        
+        grid = board.grid
+        own_occ = board.occ_white if piece.color == Color.WHITE else board.occ_black
+        targets = attacks & ~own_occ
+        while targets:
+            index = (targets & -targets).bit_length() - 1
+            targets &= targets - 1
+            target_file, target_rank = index % 8, index // 8
+            moves.append(Move(
+                from_square=square,
+                to_square=Square(target_file, target_rank),
+                piece=piece,
+                captured_piece=grid[target_rank][target_file]
+            ))
         return moves
-    
+
     def _is_valid_square(self, square: Square) -> bool:
         """
         Check if a square is within the board boundaries.
@@ -435,3 +366,14 @@ class MoveGenerator:
             return 0 <= square.file <= 7 and 0 <= square.rank <= 7
         except (ValueError, AttributeError):
             return False
+
+    # Piece-type dispatch table for generate_piece_moves; built once at
+    # class creation, after the generator methods exist
+    _GENERATORS = {
+        PieceType.PAWN: _generate_pawn_moves,
+        PieceType.KNIGHT: _generate_knight_moves,
+        PieceType.BISHOP: _generate_bishop_moves,
+        PieceType.ROOK: _generate_rook_moves,
+        PieceType.QUEEN: _generate_queen_moves,
+        PieceType.KING: _generate_king_moves,
+    }
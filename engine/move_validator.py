@@ -1,11 +1,15 @@
 """Move validation for chess moves."""
 
-from typing import List
+from typing import Dict, List, Tuple
 from models.game_state import GameState
 from models.move import Move
 from models.square import Square
-from models.piece import PieceType, Color
+from models.piece import Color, PieceType
 from engine.check_detector import CheckDetector
+from engine.attack_tables import (
+    KNIGHT_ATTACKS, PAWN_ATTACKS_WHITE, PAWN_ATTACKS_BLACK, BOARD_MASK,
+    BETWEEN, bishop_attacks, rook_attacks
+)
 
 
 class MoveValidator:
@@ -37,14 +41,162 @@ class MoveValidator:
         Returns:
             List of legal moves
         """
-        legal_moves = []
-        
-        for move in pseudo_legal_moves:
-            if self.is_legal_move(state, move):
-                legal_moves.append(move)
-        
-        return legal_moves
-    
+        if not pseudo_legal_moves:
+            return []
+
+        context = self.compute_check_context(
+            state, pseudo_legal_moves[0].piece.color
+        )
+
+        checker_count, _, pin_rays = context
+        if checker_count == 0 and not pin_rays:
+            # Not in check and nothing is pinned: every ordinary move is
+            # legal exactly as generated. Only king moves, castling and
+            # en passant depend on attacked squares, so only they need
+            # the per-move validation.
+            king = PieceType.KING
+            return [
+                move for move in pseudo_legal_moves
+                if (move.piece.piece_type != king
+                    and not move.is_castling
+                    and not move.is_en_passant)
+                or self.is_legal_in_context(state, move, context)
+            ]
+
+        return [
+            move for move in pseudo_legal_moves
+            if self.is_legal_in_context(state, move, context)
+        ]
+
+    def compute_check_context(
+        self, state: GameState, color: Color
+    ) -> Tuple[int, int, Dict[int, int]]:
+        """
+        Precompute the pin and check information legality depends on.
+
+        Scans outward from the king once per position instead of doing a
+        make/unmake check test per candidate move. The result classifies
+        every non-king, non-special move in O(1): its destination must
+        sit on the check mask, and a pinned piece must stay on its pin
+        ray.
+
+        Args:
+            state: Current game state
+            color: Color whose moves are being validated
+
+        Returns:
+            Tuple of (checker_count, check_mask, pin_rays):
+            - checker_count: number of pieces giving check
+            - check_mask: squares a non-king move may go to (blocks or
+              captures the checker; the full board when not in check)
+            - pin_rays: square index of each pinned piece -> bitboard of
+              squares it may move to without exposing the king
+        """
+        board = state.board
+        bb = board.bb
+        color_offset = 0 if color == Color.WHITE else 1
+        opp_offset = color_offset ^ 1
+
+        king_bb = bb[10 + color_offset]
+        if not king_bb:
+            return (0, BOARD_MASK, {})
+        king_index = king_bb.bit_length() - 1
+
+        occupancy = board.occ_all
+        own_occupancy = board.occ_white if color_offset == 0 else board.occ_black
+
+        # Pawn and knight checkers attack the king from fixed squares
+        pawn_table = PAWN_ATTACKS_WHITE if color_offset == 0 else PAWN_ATTACKS_BLACK
+        checkers = pawn_table[king_index] & bb[opp_offset]
+        checkers |= KNIGHT_ATTACKS[king_index] & bb[2 + opp_offset]
+        check_mask = checkers
+
+        pin_rays: Dict[int, int] = {}
+        between_from_king = BETWEEN[king_index]
+
+        diagonal_sliders = bb[4 + opp_offset] | bb[8 + opp_offset]
+        straight_sliders = bb[6 + opp_offset] | bb[8 + opp_offset]
+
+        for attacks_from, sliders in (
+            (rook_attacks, straight_sliders),
+            (bishop_attacks, diagonal_sliders)
+        ):
+            if not sliders:
+                continue
+
+            # Sliders the king sees directly are checkers; the squares
+            # between them and the king are where a block can land
+            direct = attacks_from(king_index, occupancy)
+            slider_checkers = direct & sliders
+            checkers |= slider_checkers
+            while slider_checkers:
+                checker_index = (slider_checkers & -slider_checkers).bit_length() - 1
+                check_mask |= between_from_king[checker_index] | (1 << checker_index)
+                slider_checkers &= slider_checkers - 1
+
+            # X-ray through the king's own blockers: lift them from the
+            # occupancy and look again. A slider that only now becomes
+            # visible pins the single piece standing on its ray
+            blockers = direct & own_occupancy
+            if not blockers:
+                continue
+            pinners = attacks_from(king_index, occupancy ^ blockers) & sliders & ~direct
+            while pinners:
+                pinner_index = (pinners & -pinners).bit_length() - 1
+                ray = between_from_king[pinner_index]
+                shield = ray & occupancy
+                if shield & (shield - 1) == 0:
+                    # Exactly one piece between king and slider, and it
+                    # is one of ours (enemy shields were not lifted)
+                    pinned_index = shield.bit_length() - 1
+                    pin_rays[pinned_index] = ray | (1 << pinner_index)
+                pinners &= pinners - 1
+
+        checker_count = checkers.bit_count()
+        if checker_count == 0:
+            check_mask = BOARD_MASK
+        return (checker_count, check_mask, pin_rays)
+
+    def is_legal_in_context(
+        self, state: GameState, move: Move,
+        context: Tuple[int, int, Dict[int, int]]
+    ) -> bool:
+        """
+        Check move legality using a precomputed check context.
+
+        Castling, en passant and king moves still go through the full
+        validation (their legality depends on attacked squares the
+        context doesn't carry); everything else is answered with two
+        bit tests.
+
+        Args:
+            state: Current game state
+            move: Move to validate
+            context: Result of compute_check_context for the mover's color
+
+        Returns:
+            True if the move is legal
+        """
+        if move.is_castling:
+            return self.validate_castling(state, move)
+        if move.is_en_passant:
+            return self.validate_en_passant(state, move)
+        if move.piece.piece_type == PieceType.KING:
+            return not self.would_leave_in_check(state, move)
+
+        checker_count, check_mask, pin_rays = context
+
+        # Double check: only the king can move
+        if checker_count > 1:
+            return False
+
+        to_index = move.to_square.index
+        if not (check_mask >> to_index) & 1:
+            return False
+
+        ray = pin_rays.get(move.from_square.index)
+        return ray is None or bool((ray >> to_index) & 1)
+
     def is_legal_move(self, state: GameState, move: Move) -> bool:
         """
         Check if a move is legal.
@@ -78,11 +230,15 @@ class MoveValidator:
         Returns:
             True if the move would leave the king in check
         """
-        # Create a temporary state with the move applied
-        temp_state = self._apply_move_temporarily(state, move)
-        
-        # Check if the current player's king is in check in the new state
-        return self.check_detector.is_check(temp_state, move.piece.color)
+        # Make the move on the real board, test for check, then unmake.
+        # The undo record restores the board (and its bitboards/Zobrist
+        # hash) exactly, so no board copy is needed per candidate move.
+        board = state.board
+        undo = board.make_move(move)
+        try:
+            return self.check_detector.is_check(state, move.piece.color)
+        finally:
+            board.unmake_move(undo)
     
     def validate_castling(self, state: GameState, move: Move) -> bool:
         """
@@ -149,53 +305,3 @@ class MoveValidator:
         
         # Requirement 2: Must not leave king in check
         return not self.would_leave_in_check(state, move)
-    
-    def _apply_move_temporarily(self, state: GameState, move: Move) -> GameState:
-        """
-        Apply a move to a copy of the game state for validation purposes.
-        
-        This creates a temporary state to check if a move would leave the king in check.
-        It only updates the board position, not other game state fields.
-        
-        Args:
-            state: Current game state
-            move: Move to apply
-        
-        Returns:
-            New game state with the move applied
-        """
-        # Create a copy of the state
-        temp_state = state.copy()
-        
-        # Remove piece from starting square
-        temp_state.board.remove_piece(move.from_square)
-        
-        # Handle en passant capture (remove the captured pawn)
-        if move.is_en_passant:
-            # The captured pawn is on the same rank as the moving pawn
-            captured_pawn_square = Square(move.to_square.file, move.from_square.rank)
-            temp_state.board.remove_piece(captured_pawn_square)
-        
-        # Handle castling (move the rook as well)
-        if move.is_castling:
-            rank = move.from_square.rank
-            if move.to_square.file == 6:  # Kingside
-                # Move rook from h-file to f-file
-                rook = temp_state.board.get_piece(Square(7, rank))
-                temp_state.board.remove_piece(Square(7, rank))
-                temp_state.board.set_piece(Square(5, rank), rook)
-            else:  # Queenside (file == 2)
-                # Move rook from a-file to d-file
-                rook = temp_state.board.get_piece(Square(0, rank))
-                temp_state.board.remove_piece(Square(0, rank))
-                temp_state.board.set_piece(Square(3, rank), rook)
-        
-        # Place piece at destination square (handle promotion)
-        if move.promotion_piece is not None:
-            from models.piece import Piece
-            promoted_piece = Piece(move.promotion_piece, move.piece.color)
-            temp_state.board.set_piece(move.to_square, promoted_piece)
-        else:
-            temp_state.board.set_piece(move.to_square, move.piece)
-        
-        return temp_state
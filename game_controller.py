@@ -30,6 +30,16 @@ class GameController:
         self.state: Optional[GameState] = None
         self.selected_square: Optional[Square] = None
         self.pending_promotion_move: Optional[Move] = None
+        # The four promotion variants of the pending move, keyed by
+        # promotion piece type; all were already generated (and
+        # validated) with the legal-move list, so the eventual choice
+        # just picks one
+        self.pending_promotion_choices: dict = {}
+        # Cache of the last per-square legal-move list: selecting a
+        # piece and then attempting a move both need the same list, so
+        # the second call reuses the first one's result. Keyed by
+        # position and square so any state change invalidates it.
+        self._selection_cache = None
     
     def start_new_game(self, mode: GameMode) -> GameState:
         """
@@ -46,6 +56,8 @@ class GameController:
         self.state = self.engine.initialize_game(mode)
         self.selected_square = None
         self.pending_promotion_move = None
+        self.pending_promotion_choices = {}
+        self._selection_cache = None
         return self.state
     
     def handle_square_selection(self, square: Square) -> dict:
@@ -159,8 +171,15 @@ class GameController:
         
         # Check if this is a pawn promotion (Requirement 3.5)
         if self._is_promotion_move(move):
-            # Store the move and wait for promotion choice
+            # Store the move and wait for promotion choice. The move
+            # generator produced one legal variant per promotion piece;
+            # keep them all so the choice needs no regeneration
             self.pending_promotion_move = move
+            self.pending_promotion_choices = {
+                m.promotion_piece: m
+                for m in legal_moves
+                if m.from_square == from_square and m.to_square == to_square
+            }
             return {
                 'action': 'promotion_required',
                 'move': move,
@@ -192,14 +211,19 @@ class GameController:
         # Validate promotion piece type
         if piece_type not in [PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT]:
             raise ValueError(f"Invalid promotion piece type: {piece_type}")
-        
-        # Set the promotion piece on the move
-        self.pending_promotion_move.promotion_piece = piece_type
-        
-        # Execute the move
-        move = self.pending_promotion_move
+
+        # Pick the prebuilt variant for the chosen piece; it was
+        # generated and validated along with the original move list
+        move = self.pending_promotion_choices.get(
+            piece_type, self.pending_promotion_move
+        )
         self.pending_promotion_move = None
-        
+        self.pending_promotion_choices = {}
+
+        if move.promotion_piece != piece_type:
+            # Fallback for a hand-set pending move without variants
+            move.promotion_piece = piece_type
+
         return self._execute_move_and_check_game_state(move)
     
     def get_current_state(self) -> Optional[GameState]:
@@ -277,16 +301,26 @@ class GameController:
         """
         if self.state is None:
             return []
-        
+
         piece = self.state.board.get_piece(square)
         if piece is None:
             return []
-        
+
+        # Reuse the list computed when the square was selected: the
+        # follow-up move attempt (and the UI's highlight query) ask for
+        # the same square in the same position
+        cache_key = (self.engine.position_key(self.state), square)
+        cached = self._selection_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
         # Get all legal moves for the current player
         all_legal_moves = self.engine.get_legal_moves(self.state, self.state.current_player)
-        
+
         # Filter to moves from this square
-        return [move for move in all_legal_moves if move.from_square == square]
+        moves = [move for move in all_legal_moves if move.from_square == square]
+        self._selection_cache = (cache_key, moves)
+        return moves
     
     def _find_move(self, legal_moves: List[Move], from_square: Square, to_square: Square) -> Optional[Move]:
         """
@@ -337,6 +371,7 @@ class GameController:
         # Execute the move
         self.state = self.engine.execute_move(self.state, move)
         self.selected_square = None
+        self._selection_cache = None
         
         # Check for game-ending conditions
         if self.engine.is_checkmate(self.state):
@@ -1,127 +1,358 @@
 """Board component for managing the 8x8 chess board and piece positions."""
 
 from typing import Optional, List, Dict
-from copy import deepcopy
 from .piece import Piece, PieceType, Color
 from .square import Square
+from .zobrist import ZOBRIST_PIECES
+
+
+# Index tables mapping enum members to bitboard indices. A piece's bitboard
+# lives at bb[type_index * 2 + color_index].
+_PIECE_TYPES = (
+    PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+    PieceType.ROOK, PieceType.QUEEN, PieceType.KING
+)
+_TYPE_INDEX = {piece_type: index for index, piece_type in enumerate(_PIECE_TYPES)}
+_COLOR_INDEX = {Color.WHITE: 0, Color.BLACK: 1}
+
+# Template board for the standard starting position, built on the first
+# setup_standard_position() call. Later calls copy its grid rows and
+# precomputed bitboards instead of placing 32 pieces and rebuilding.
+_START_TEMPLATE = None
 
 
 class Board:
-    """Manages the 8x8 chess board and piece positions."""
-    
+    """
+    Manages the 8x8 chess board and piece positions.
+
+    Piece placement is tracked in two synchronized representations:
+
+    - ``bb``: 12 bitboards (one 64-bit int per (piece type, color) pair,
+      indexed by ``type_index * 2 + color_index``) plus the occupancy
+      bitboards ``occ_white``, ``occ_black`` and ``occ_all``. These make
+      set-membership, occupancy and counting questions single bitwise ops.
+    - ``grid``: the 8x8 mailbox of Piece references, kept as the decode
+      path so ``get_piece`` stays a single list index.
+
+    A Zobrist hash of the piece placement (``zobrist``) is maintained
+    incrementally with one XOR per mutation.
+
+    ``set_piece`` / ``remove_piece`` update both representations
+    incrementally; assigning a new ``grid`` wholesale rebuilds the
+    bitboards from it.
+    """
+
+    __slots__ = ('_grid', 'bb', 'occ_white', 'occ_black', 'occ_all', 'zobrist')
+
     def __init__(self):
         """Initialize an empty 8x8 board."""
         # 8x8 grid where None represents empty square
         # grid[rank][file] corresponds to the square at (file, rank)
-        self.grid: List[List[Optional[Piece]]] = [[None for _ in range(8)] for _ in range(8)]
-    
+        self._grid: List[List[Optional[Piece]]] = [[None for _ in range(8)] for _ in range(8)]
+        self.bb: List[int] = [0] * 12
+        self.occ_white: int = 0
+        self.occ_black: int = 0
+        self.occ_all: int = 0
+        self.zobrist: int = 0
+
+    @property
+    def grid(self) -> List[List[Optional[Piece]]]:
+        """The 8x8 mailbox grid of pieces (grid[rank][file])."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, new_grid: List[List[Optional[Piece]]]) -> None:
+        self._grid = new_grid
+        self._rebuild_bitboards()
+
+    def _rebuild_bitboards(self) -> None:
+        """Recompute all bitboards from the mailbox grid."""
+        self.bb = [0] * 12
+        self.occ_white = 0
+        self.occ_black = 0
+        self.zobrist = 0
+        index = 0
+        for row in self._grid:
+            for piece in row:
+                if piece is not None:
+                    mask = 1 << index
+                    piece_index = _TYPE_INDEX[piece.piece_type] * 2 + _COLOR_INDEX[piece.color]
+                    self.bb[piece_index] |= mask
+                    self.zobrist ^= ZOBRIST_PIECES[piece_index][index]
+                    if piece.color == Color.WHITE:
+                        self.occ_white |= mask
+                    else:
+                        self.occ_black |= mask
+                index += 1
+        self.occ_all = self.occ_white | self.occ_black
+
     def get_piece(self, square: Square) -> Optional[Piece]:
         """
         Get the piece at the given square.
-        
+
         Args:
             square: The square to check
-        
+
         Returns:
             The piece at the square, or None if empty
         """
-        return self.grid[square.rank][square.file]
-    
+        return self._grid[square.rank][square.file]
+
     def set_piece(self, square: Square, piece: Piece) -> None:
         """
         Place a piece at the given square.
-        
+
         Args:
             square: The square to place the piece
             piece: The piece to place
         """
-        self.grid[square.rank][square.file] = piece
-    
+        rank, file = square.rank, square.file
+        index = rank * 8 + file
+        mask = 1 << index
+
+        # Clear any piece already occupying the square
+        existing = self._grid[rank][file]
+        if existing is not None:
+            existing_index = _TYPE_INDEX[existing.piece_type] * 2 + _COLOR_INDEX[existing.color]
+            self.bb[existing_index] &= ~mask
+            self.zobrist ^= ZOBRIST_PIECES[existing_index][index]
+
+        self._grid[rank][file] = piece
+        piece_index = _TYPE_INDEX[piece.piece_type] * 2 + _COLOR_INDEX[piece.color]
+        self.bb[piece_index] |= mask
+        self.zobrist ^= ZOBRIST_PIECES[piece_index][index]
+        if piece.color == Color.WHITE:
+            self.occ_white |= mask
+            self.occ_black &= ~mask
+        else:
+            self.occ_black |= mask
+            self.occ_white &= ~mask
+        self.occ_all |= mask
+
     def remove_piece(self, square: Square) -> None:
         """
         Remove the piece from the given square.
-        
+
         Args:
             square: The square to clear
         """
-        self.grid[square.rank][square.file] = None
-    
+        rank, file = square.rank, square.file
+        existing = self._grid[rank][file]
+        if existing is None:
+            return
+
+        index = rank * 8 + file
+        mask = 1 << index
+        self._grid[rank][file] = None
+        existing_index = _TYPE_INDEX[existing.piece_type] * 2 + _COLOR_INDEX[existing.color]
+        self.bb[existing_index] &= ~mask
+        self.zobrist ^= ZOBRIST_PIECES[existing_index][index]
+        self.occ_white &= ~mask
+        self.occ_black &= ~mask
+        self.occ_all &= ~mask
+
     def get_all_pieces(self, color: Color) -> Dict[Square, Piece]:
         """
         Get all pieces of a given color.
-        
+
         Args:
             color: The color of pieces to retrieve
-        
+
         Returns:
             Dictionary mapping squares to pieces for all pieces of the given color
         """
         pieces = {}
-        for rank in range(8):
-            for file in range(8):
-                piece = self.grid[rank][file]
-                if piece is not None and piece.color == color:
-                    square = Square(file, rank)
-                    pieces[square] = piece
+        occ = self.occ_white if color == Color.WHITE else self.occ_black
+        grid = self._grid
+        while occ:
+            index = (occ & -occ).bit_length() - 1
+            occ &= occ - 1
+            file, rank = index % 8, index // 8
+            pieces[Square(file, rank)] = grid[rank][file]
         return pieces
-    
+
+    def count_pieces(self, color: Color) -> int:
+        """
+        Count the pieces of a given color.
+
+        A single popcount of the occupancy bitboard, with no piece
+        enumeration.
+
+        Args:
+            color: The color of pieces to count
+
+        Returns:
+            Number of pieces of the given color on the board
+        """
+        occ = self.occ_white if color == Color.WHITE else self.occ_black
+        return occ.bit_count()
+
+    def iter_occupied(self):
+        """
+        Iterate over occupied squares only.
+
+        Yields:
+            Tuples of (square_index, piece) where square_index is
+            rank * 8 + file, skipping empty squares entirely
+        """
+        occ = self.occ_all
+        grid = self._grid
+        while occ:
+            index = (occ & -occ).bit_length() - 1
+            occ &= occ - 1
+            yield index, grid[index // 8][index % 8]
+
+    def clear(self) -> None:
+        """Remove all pieces, resetting the board to empty."""
+        self._grid = [[None for _ in range(8)] for _ in range(8)]
+        self.bb = [0] * 12
+        self.occ_white = 0
+        self.occ_black = 0
+        self.occ_all = 0
+        self.zobrist = 0
+
+    def make_move(self, move) -> List:
+        """
+        Apply a move to the board in place and return an undo record.
+
+        Handles captures, en passant, castling rook relocation and pawn
+        promotion. The record holds the prior contents of every square
+        the move touches; passing it to unmake_move restores the board
+        exactly, with set_piece/remove_piece keeping the bitboards and
+        Zobrist hash consistent in both directions. This allows callers
+        to try a move and roll it back without copying the board.
+
+        Args:
+            move: Move to apply
+
+        Returns:
+            Undo record for unmake_move
+        """
+        from_square = move.from_square
+        to_square = move.to_square
+        undo = [
+            (from_square, self.get_piece(from_square)),
+            (to_square, self.get_piece(to_square))
+        ]
+
+        self.remove_piece(from_square)
+
+        # En passant: the captured pawn sits beside the moving pawn, not
+        # on the destination square
+        if move.is_en_passant:
+            captured_square = Square(to_square.file, from_square.rank)
+            undo.append((captured_square, self.get_piece(captured_square)))
+            self.remove_piece(captured_square)
+
+        # Castling: relocate the rook as well
+        if move.is_castling:
+            rank = from_square.rank
+            if to_square.file == 6:  # Kingside
+                rook_from, rook_to = Square(7, rank), Square(5, rank)
+            else:  # Queenside (file == 2)
+                rook_from, rook_to = Square(0, rank), Square(3, rank)
+            undo.append((rook_from, self.get_piece(rook_from)))
+            undo.append((rook_to, self.get_piece(rook_to)))
+            rook = self.get_piece(rook_from)
+            self.remove_piece(rook_from)
+            self.set_piece(rook_to, rook)
+
+        # Place the piece (promoted if applicable) on the destination
+        if move.promotion_piece is not None:
+            self.set_piece(to_square, Piece(move.promotion_piece, move.piece.color))
+        else:
+            self.set_piece(to_square, move.piece)
+
+        return undo
+
+    def unmake_move(self, undo: List) -> None:
+        """
+        Restore the board to its state before the matching make_move.
+
+        Args:
+            undo: Record returned by make_move
+        """
+        for square, piece in undo:
+            if piece is None:
+                self.remove_piece(square)
+            else:
+                self.set_piece(square, piece)
+
     def copy(self) -> 'Board':
         """
-        Create a deep copy of the board.
-        
+        Create a copy of the board.
+
+        Pieces themselves are immutable value objects, so the copy shares
+        piece references while duplicating the grid rows and bitboards.
+
         Returns:
             A new Board instance with the same piece positions
         """
-        new_board = Board()
-        for rank in range(8):
-            for file in range(8):
-                piece = self.grid[rank][file]
-                if piece is not None:
-                    # Create new Piece instances to ensure deep copy
-                    new_board.grid[rank][file] = Piece(piece.piece_type, piece.color)
-                else:
-                    new_board.grid[rank][file] = None
+        new_board = Board.__new__(Board)
+        new_board._grid = [row[:] for row in self._grid]
+        new_board.bb = self.bb[:]
+        new_board.occ_white = self.occ_white
+        new_board.occ_black = self.occ_black
+        new_board.occ_all = self.occ_all
+        new_board.zobrist = self.zobrist
         return new_board
-    
+
     def setup_standard_position(self) -> None:
         """
         Set up the board with all pieces in their standard starting positions.
-        
+
         Standard chess starting position:
         - Rank 1 (white): Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook
         - Rank 2 (white): All pawns
         - Rank 7 (black): All pawns
         - Rank 8 (black): Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook
         """
+        global _START_TEMPLATE
+
+        # After the first setup, reuse the template's rows, bitboards
+        # and hash wholesale
+        if _START_TEMPLATE is not None:
+            self._grid = [row[:] for row in _START_TEMPLATE._grid]
+            self.bb = _START_TEMPLATE.bb[:]
+            self.occ_white = _START_TEMPLATE.occ_white
+            self.occ_black = _START_TEMPLATE.occ_black
+            self.occ_all = _START_TEMPLATE.occ_all
+            self.zobrist = _START_TEMPLATE.zobrist
+            return
+
         # Clear the board first
-        self.grid = [[None for _ in range(8)] for _ in range(8)]
-        
+        grid = [[None for _ in range(8)] for _ in range(8)]
+
         # Set up white pieces (rank 0 = rank 1 in chess notation)
         piece_order = [
             PieceType.ROOK, PieceType.KNIGHT, PieceType.BISHOP, PieceType.QUEEN,
             PieceType.KING, PieceType.BISHOP, PieceType.KNIGHT, PieceType.ROOK
         ]
-        
+
         for file, piece_type in enumerate(piece_order):
             # White pieces on rank 1 (index 0)
-            self.grid[0][file] = Piece(piece_type, Color.WHITE)
+            grid[0][file] = Piece(piece_type, Color.WHITE)
             # Black pieces on rank 8 (index 7)
-            self.grid[7][file] = Piece(piece_type, Color.BLACK)
-        
+            grid[7][file] = Piece(piece_type, Color.BLACK)
+
         # Set up pawns
         for file in range(8):
             # White pawns on rank 2 (index 1)
-            self.grid[1][file] = Piece(PieceType.PAWN, Color.WHITE)
+            grid[1][file] = Piece(PieceType.PAWN, Color.WHITE)
             # Black pawns on rank 7 (index 6)
-            self.grid[6][file] = Piece(PieceType.PAWN, Color.BLACK)
-    
+            grid[6][file] = Piece(PieceType.PAWN, Color.BLACK)
+
+        # Assigning through the property rebuilds the bitboards
+        self.grid = grid
+        _START_TEMPLATE = self.copy()
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         lines = []
         for rank in range(7, -1, -1):  # Display from rank 8 to rank 1
             line = f"{rank + 1} "
             for file in range(8):
-                piece = self.grid[rank][file]
+                piece = self._grid[rank][file]
                 if piece is None:
                     line += ". "
                 else:
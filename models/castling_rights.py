@@ -5,8 +5,23 @@ from .square import Square
 
 
 class CastlingRights:
-    """Tracks which castling moves are still available for each player."""
-    
+    """
+    Tracks which castling moves are still available for each player.
+
+    The four rights are packed into a single integer bitmask so that
+    copying rights is a plain int copy instead of re-running ``__init__``
+    with four keyword arguments. The individual rights remain accessible
+    as boolean properties.
+    """
+
+    __slots__ = ('bits',)
+
+    # Bit positions for each right
+    _WHITE_KINGSIDE = 1
+    _WHITE_QUEENSIDE = 2
+    _BLACK_KINGSIDE = 4
+    _BLACK_QUEENSIDE = 8
+
     def __init__(
         self,
         white_kingside: bool = True,
@@ -16,22 +31,89 @@ class CastlingRights:
     ):
         """
         Initialize castling rights.
-        
+
         Args:
             white_kingside: Can white castle kingside
             white_queenside: Can white castle queenside
             black_kingside: Can black castle kingside
             black_queenside: Can black castle queenside
         """
-        self.white_kingside = white_kingside
-        self.white_queenside = white_queenside
-        self.black_kingside = black_kingside
-        self.black_queenside = black_queenside
-    
+        self.bits = (
+            (self._WHITE_KINGSIDE if white_kingside else 0) |
+            (self._WHITE_QUEENSIDE if white_queenside else 0) |
+            (self._BLACK_KINGSIDE if black_kingside else 0) |
+            (self._BLACK_QUEENSIDE if black_queenside else 0)
+        )
+
+    @property
+    def white_kingside(self) -> bool:
+        """Whether white can still castle kingside."""
+        return bool(self.bits & self._WHITE_KINGSIDE)
+
+    @white_kingside.setter
+    def white_kingside(self, value: bool) -> None:
+        if value:
+            self.bits |= self._WHITE_KINGSIDE
+        else:
+            self.bits &= ~self._WHITE_KINGSIDE
+
+    @property
+    def white_queenside(self) -> bool:
+        """Whether white can still castle queenside."""
+        return bool(self.bits & self._WHITE_QUEENSIDE)
+
+    @white_queenside.setter
+    def white_queenside(self, value: bool) -> None:
+        if value:
+            self.bits |= self._WHITE_QUEENSIDE
+        else:
+            self.bits &= ~self._WHITE_QUEENSIDE
+
+    @property
+    def black_kingside(self) -> bool:
+        """Whether black can still castle kingside."""
+        return bool(self.bits & self._BLACK_KINGSIDE)
+
+    @black_kingside.setter
+    def black_kingside(self, value: bool) -> None:
+        if value:
+            self.bits |= self._BLACK_KINGSIDE
+        else:
+            self.bits &= ~self._BLACK_KINGSIDE
+
+    @property
+    def black_queenside(self) -> bool:
+        """Whether black can still castle queenside."""
+        return bool(self.bits & self._BLACK_QUEENSIDE)
+
+    @black_queenside.setter
+    def black_queenside(self, value: bool) -> None:
+        if value:
+            self.bits |= self._BLACK_QUEENSIDE
+        else:
+            self.bits &= ~self._BLACK_QUEENSIDE
+
+    def revoke_for_move(self, from_index: int, to_index: int) -> None:
+        """
+        Revoke whatever castling rights a move invalidates.
+
+        Covers every case with two table reads: the king leaving its
+        start square drops both of its rights, a rook leaving (or a
+        capture landing on) a corner square drops that side's right.
+        Squares that never affect castling keep all bits. Touching a
+        square whose right is already gone is a no-op, so no piece-type
+        checks are needed.
+
+        Args:
+            from_index: Square index the piece moved from
+            to_index: Square index the piece moved to
+        """
+        self.bits &= _KEEP_MASKS[from_index] & _KEEP_MASKS[to_index]
+
     def revoke_for_piece(self, piece_type: PieceType, color: Color, square: Square) -> None:
         """
         Revoke castling rights when a king or rook moves.
-        
+
         Args:
             piece_type: Type of piece that moved
             color: Color of the piece
@@ -40,76 +122,85 @@ class CastlingRights:
         if piece_type == PieceType.KING:
             # King moved - revoke both castling rights for that color
             if color == Color.WHITE:
-                self.white_kingside = False
-                self.white_queenside = False
+                self.bits &= ~(self._WHITE_KINGSIDE | self._WHITE_QUEENSIDE)
             else:
-                self.black_kingside = False
-                self.black_queenside = False
-        
+                self.bits &= ~(self._BLACK_KINGSIDE | self._BLACK_QUEENSIDE)
+
         elif piece_type == PieceType.ROOK:
             # Rook moved - revoke castling on that side
             if color == Color.WHITE:
                 if square.file == 0 and square.rank == 0:  # a1 - queenside
-                    self.white_queenside = False
+                    self.bits &= ~self._WHITE_QUEENSIDE
                 elif square.file == 7 and square.rank == 0:  # h1 - kingside
-                    self.white_kingside = False
+                    self.bits &= ~self._WHITE_KINGSIDE
             else:
                 if square.file == 0 and square.rank == 7:  # a8 - queenside
-                    self.black_queenside = False
+                    self.bits &= ~self._BLACK_QUEENSIDE
                 elif square.file == 7 and square.rank == 7:  # h8 - kingside
-                    self.black_kingside = False
-    
+                    self.bits &= ~self._BLACK_KINGSIDE
+
     def revoke_for_rook_capture(self, square: Square) -> None:
         """
         Revoke castling rights when a rook is captured.
-        
+
         Args:
             square: Square where the rook was captured
         """
         # Check if a rook on a starting square was captured
         if square.file == 0 and square.rank == 0:  # a1 - white queenside
-            self.white_queenside = False
+            self.bits &= ~self._WHITE_QUEENSIDE
         elif square.file == 7 and square.rank == 0:  # h1 - white kingside
-            self.white_kingside = False
+            self.bits &= ~self._WHITE_KINGSIDE
         elif square.file == 0 and square.rank == 7:  # a8 - black queenside
-            self.black_queenside = False
+            self.bits &= ~self._BLACK_QUEENSIDE
         elif square.file == 7 and square.rank == 7:  # h8 - black kingside
-            self.black_kingside = False
-    
+            self.bits &= ~self._BLACK_KINGSIDE
+
     def copy(self) -> 'CastlingRights':
         """
-        Create a deep copy of castling rights.
-        
+        Create a copy of castling rights.
+
+        Skips __init__ entirely - the packed bitmask is the only state,
+        so copying is a single int assignment.
+
         Returns:
             New CastlingRights instance with same values
         """
-        return CastlingRights(
-            white_kingside=self.white_kingside,
-            white_queenside=self.white_queenside,
-            black_kingside=self.black_kingside,
-            black_queenside=self.black_queenside
-        )
-    
+        new_rights = CastlingRights.__new__(CastlingRights)
+        new_rights.bits = self.bits
+        return new_rights
+
     def __eq__(self, other) -> bool:
         """Check equality with another CastlingRights."""
         if not isinstance(other, CastlingRights):
             return False
-        return (
-            self.white_kingside == other.white_kingside and
-            self.white_queenside == other.white_queenside and
-            self.black_kingside == other.black_kingside and
-            self.black_queenside == other.black_queenside
-        )
-    
+        return self.bits == other.bits
+
     def __repr__(self) -> str:
         """String representation for debugging."""
-        rights = []
-        if self.white_kingside:
-            rights.append("K")
-        if self.white_queenside:
-            rights.append("Q")
-        if self.black_kingside:
-            rights.append("k")
-        if self.black_queenside:
-            rights.append("q")
-        return f"CastlingRights({''.join(rights) if rights else '-'})"
+        return _CASTLING_REPR[self.bits]
+
+
+# All 16 repr strings, precomputed once and indexed by the packed bits so
+# __repr__ is a single tuple lookup instead of a list-append loop.
+_CASTLING_REPR = tuple(
+    "CastlingRights({})".format(
+        (("K" if bits & 1 else "") +
+         ("Q" if bits & 2 else "") +
+         ("k" if bits & 4 else "") +
+         ("q" if bits & 8 else "")) or "-"
+    )
+    for bits in range(16)
+)
+
+# Bits a move touching each square leaves intact, used by
+# revoke_for_move. Only the six castling-relevant start squares mask
+# anything: the corners drop one right each, the king squares both.
+_KEEP_MASKS = [0b1111] * 64
+_KEEP_MASKS[0] = 0b1101    # a1: white queenside
+_KEEP_MASKS[4] = 0b1100    # e1: both white rights
+_KEEP_MASKS[7] = 0b1110    # h1: white kingside
+_KEEP_MASKS[56] = 0b0111   # a8: black queenside
+_KEEP_MASKS[60] = 0b0011   # e8: both black rights
+_KEEP_MASKS[63] = 0b1011   # h8: black kingside
+_KEEP_MASKS = tuple(_KEEP_MASKS)
@@ -7,6 +7,20 @@ from .piece import Color
 from .castling_rights import CastlingRights
 from .square import Square
 from .move import Move
+from .zobrist import ZOBRIST_SIDE, ZOBRIST_CASTLING, ZOBRIST_EP
+
+
+# Algebraic names for all 64 square indices, precomputed once so __repr__
+# and other formatting paths avoid building Square objects and strings.
+_SQUARE_NAMES = tuple(
+    f"{'abcdefgh'[index % 8]}{index // 8 + 1}" for index in range(64)
+)
+
+# Template for the standard starting position, built lazily on the first
+# new_game() call. Subsequent games clone it instead of re-placing all
+# 32 pieces; the matching position hash is cached alongside it.
+_INITIAL_BOARD = None
+_INITIAL_HASH = None
 
 
 class GameMode(Enum):
@@ -22,7 +36,13 @@ class GameState:
     This includes the board position, whose turn it is, castling rights,
     en passant availability, move counters, and game history.
     """
-    
+
+    __slots__ = (
+        'board', 'current_player', 'castling_rights', 'en_passant_index',
+        'halfmove_clock', 'fullmove_number', 'move_history',
+        'position_history', 'repetition_counts', 'game_mode', '_legal_cache'
+    )
+
     def __init__(
         self,
         board: Board,
@@ -52,34 +72,84 @@ class GameState:
         self.board = board
         self.current_player = current_player
         self.castling_rights = castling_rights
-        self.en_passant_target = en_passant_target
+        # En passant target is stored as a square index 0-63, with -1
+        # meaning no en passant capture is available. The Optional[Square]
+        # view remains available via the en_passant_target property.
+        self.en_passant_index = (
+            -1 if en_passant_target is None
+            else en_passant_target.rank * 8 + en_passant_target.file
+        )
         self.halfmove_clock = halfmove_clock
         self.fullmove_number = fullmove_number
         self.move_history = move_history if move_history is not None else []
         self.position_history = position_history if position_history is not None else []
+        # Occurrence count per position hash, kept in sync with
+        # position_history so threefold-repetition checks are a dict
+        # lookup instead of a list scan
+        self.repetition_counts = {}
+        for position_hash in self.position_history:
+            self.repetition_counts[position_hash] = (
+                self.repetition_counts.get(position_hash, 0) + 1
+            )
         self.game_mode = game_mode
-    
+        # Per-color cache of legal move lists, managed by
+        # ChessEngine.get_legal_moves. Never copied: a fresh state (and
+        # the copies execute_move produces) starts with an empty cache.
+        self._legal_cache = {}
+
+    @property
+    def en_passant_target(self) -> Optional[Square]:
+        """
+        En passant target square as an Optional[Square].
+
+        Returns:
+            Square where en passant capture is possible, or None
+        """
+        if self.en_passant_index < 0:
+            return None
+        return Square(self.en_passant_index % 8, self.en_passant_index // 8)
+
+    @en_passant_target.setter
+    def en_passant_target(self, square: Optional[Square]) -> None:
+        self.en_passant_index = (
+            -1 if square is None else square.rank * 8 + square.file
+        )
+
     @classmethod
-    def new_game(cls, mode: GameMode = GameMode.MULTIPLAYER) -> 'GameState':
+    def new_game(
+        cls,
+        mode: GameMode = GameMode.MULTIPLAYER,
+        starting_position: bool = True
+    ) -> 'GameState':
         """
         Create a new game state with standard starting position.
-        
+
         Args:
             mode: Game mode (single-player or multiplayer)
-        
+            starting_position: When False, the board is left empty —
+                useful for tests that place their own pieces instead of
+                setting up and then clearing the standard position
+
         Returns:
             GameState initialized for a new game
         """
-        board = Board()
-        board.setup_standard_position()
-        
+        global _INITIAL_BOARD, _INITIAL_HASH
+
+        if starting_position:
+            if _INITIAL_BOARD is None:
+                _INITIAL_BOARD = Board()
+                _INITIAL_BOARD.setup_standard_position()
+            board = _INITIAL_BOARD.copy()
+        else:
+            board = Board()
+
         castling_rights = CastlingRights(
             white_kingside=True,
             white_queenside=True,
             black_kingside=True,
             black_queenside=True
         )
-        
+
         state = cls(
             board=board,
             current_player=Color.WHITE,
@@ -91,12 +161,31 @@ class GameState:
             position_history=[],
             game_mode=mode
         )
-        
-        # Add initial position to history
-        state.position_history.append(state.compute_position_hash())
-        
+
+        # Add initial position to history (for the standard setup the
+        # hash never varies, so it is computed once and reused)
+        if starting_position:
+            if _INITIAL_HASH is None:
+                _INITIAL_HASH = state.compute_position_hash()
+            state.record_position(_INITIAL_HASH)
+        else:
+            state.record_position(state.compute_position_hash())
+
         return state
     
+    def record_position(self, position_hash: int) -> None:
+        """
+        Append a position hash to the history, keeping the repetition
+        counts in sync.
+
+        Args:
+            position_hash: Hash of the position to record
+        """
+        self.position_history.append(position_hash)
+        self.repetition_counts[position_hash] = (
+            self.repetition_counts.get(position_hash, 0) + 1
+        )
+
     def compute_position_hash(self) -> int:
         """
         Compute a hash of the current position for threefold repetition detection.
@@ -107,38 +196,25 @@ class GameState:
         - Castling rights
         - En passant target square
         
+        The piece-placement portion is the Zobrist hash the Board keeps
+        up to date incrementally, so this is a handful of XORs rather
+        than a board scan.
+        
         Returns:
             Integer hash representing the position
         """
-        # Start with a base hash
-        hash_value = 0
-        
-        # Hash piece positions
-        for rank in range(8):
-            for file in range(8):
-                piece = self.board.grid[rank][file]
-                if piece is not None:
-                    # Combine square position, piece type, and color into hash
-                    square_hash = (rank * 8 + file)
-                    piece_hash = hash((piece.piece_type, piece.color))
-                    hash_value ^= (square_hash * 31 + piece_hash)
+        hash_value = self.board.zobrist
         
         # Hash current player
-        hash_value ^= hash(self.current_player) * 17
+        if self.current_player == Color.BLACK:
+            hash_value ^= ZOBRIST_SIDE
         
         # Hash castling rights
-        castling_hash = (
-            (1 if self.castling_rights.white_kingside else 0) |
-            (2 if self.castling_rights.white_queenside else 0) |
-            (4 if self.castling_rights.black_kingside else 0) |
-            (8 if self.castling_rights.black_queenside else 0)
-        )
-        hash_value ^= castling_hash * 13
+        hash_value ^= ZOBRIST_CASTLING[self.castling_rights.bits]
         
-        # Hash en passant target
-        if self.en_passant_target is not None:
-            ep_hash = self.en_passant_target.rank * 8 + self.en_passant_target.file
-            hash_value ^= ep_hash * 19
+        # Hash en passant target (by file)
+        if self.en_passant_index >= 0:
+            hash_value ^= ZOBRIST_EP[self.en_passant_index % 8]
         
         return hash_value
     
@@ -169,7 +245,7 @@ class GameState:
             f"  fullmove={self.fullmove_number},\n"
             f"  halfmove_clock={self.halfmove_clock},\n"
             f"  castling={self.castling_rights},\n"
-            f"  en_passant={self.en_passant_target.to_algebraic() if self.en_passant_target else None},\n"
+            f"  en_passant={_SQUARE_NAMES[self.en_passant_index] if self.en_passant_index >= 0 else None},\n"
             f"  mode={self.game_mode.value}\n"
             f")"
         )
@@ -2,12 +2,70 @@
 
 from typing import Optional
 from .square import Square
-from .piece import Piece, PieceType
+from .piece import Piece, PieceType, Color
+
+
+# Index tables used for packing enum fields into the move integer
+_PIECE_TYPES = (
+    PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+    PieceType.ROOK, PieceType.QUEEN, PieceType.KING
+)
+_TYPE_INDEX = {piece_type: index for index, piece_type in enumerate(_PIECE_TYPES)}
+_COLORS = (Color.WHITE, Color.BLACK)
+_COLOR_INDEX = {Color.WHITE: 0, Color.BLACK: 1}
+
+# Prebuilt Square for every index 0-63 so the from_square/to_square
+# properties decode without constructing (and bounds-checking) a Square
+_SQUARES = tuple(Square(index % 8, index // 8) for index in range(64))
+
+# Notation letters, precomputed so to_algebraic_notation avoids building
+# a fresh dict on every call (pawns have no letter)
+_PIECE_LETTER = {
+    PieceType.PAWN: '',
+    PieceType.KNIGHT: 'N',
+    PieceType.BISHOP: 'B',
+    PieceType.ROOK: 'R',
+    PieceType.QUEEN: 'Q',
+    PieceType.KING: 'K'
+}
+_PROMO_LETTER = {
+    PieceType.KNIGHT: '=N',
+    PieceType.BISHOP: '=B',
+    PieceType.ROOK: '=R',
+    PieceType.QUEEN: '=Q'
+}
+
+# Branchless suffix/castling selection: index by (is_checkmate << 1) | is_check
+# and by whether the king lands on the g-file
+_CHECK_SUFFIX = ('', '+', '#', '#')
+_CASTLE_NOTATION = ('O-O-O', 'O-O')
 
 
 class Move:
-    """Represents a chess move with all necessary information."""
-    
+    """
+    Represents a chess move with all necessary information.
+
+    The move is packed into a single integer to keep move lists compact
+    and make hashing/equality a plain int comparison. Bit layout:
+
+        bits  0-5   from square (rank * 8 + file)
+        bits  6-11  to square (rank * 8 + file)
+        bits 12-14  moving piece type
+        bit  15     moving piece color
+        bit  16     captured piece present
+        bits 17-19  captured piece type
+        bit  20     captured piece color
+        bit  21     promotion piece present
+        bits 22-24  promotion piece type
+        bit  25     castling flag
+        bit  26     en passant flag
+
+    The original attributes (from_square, to_square, piece, ...) remain
+    available as properties that decode fields on demand.
+    """
+
+    __slots__ = ('p',)
+
     def __init__(
         self,
         from_square: Square,
@@ -20,7 +78,7 @@ class Move:
     ):
         """
         Initialize a move.
-        
+
         Args:
             from_square: Starting position
             to_square: Destination position
@@ -30,52 +88,93 @@ class Move:
             is_castling: Flag for castling moves
             is_en_passant: Flag for en passant captures
         """
-        self.from_square = from_square
-        self.to_square = to_square
-        self.piece = piece
-        self.captured_piece = captured_piece
-        self.promotion_piece = promotion_piece
-        self.is_castling = is_castling
-        self.is_en_passant = is_en_passant
-    
+        packed = (
+            (from_square.rank * 8 + from_square.file) |
+            ((to_square.rank * 8 + to_square.file) << 6) |
+            (_TYPE_INDEX[piece.piece_type] << 12) |
+            (_COLOR_INDEX[piece.color] << 15)
+        )
+        if captured_piece is not None:
+            packed |= (
+                (1 << 16) |
+                (_TYPE_INDEX[captured_piece.piece_type] << 17) |
+                (_COLOR_INDEX[captured_piece.color] << 20)
+            )
+        if promotion_piece is not None:
+            packed |= (1 << 21) | (_TYPE_INDEX[promotion_piece] << 22)
+        if is_castling:
+            packed |= 1 << 25
+        if is_en_passant:
+            packed |= 1 << 26
+        self.p = packed
+
+    @property
+    def from_square(self) -> Square:
+        """Starting square of the move."""
+        return _SQUARES[self.p & 0x3F]
+
+    @property
+    def to_square(self) -> Square:
+        """Destination square of the move."""
+        return _SQUARES[(self.p >> 6) & 0x3F]
+
+    @property
+    def piece(self) -> Piece:
+        """Piece being moved."""
+        return Piece(_PIECE_TYPES[(self.p >> 12) & 0x7], _COLORS[(self.p >> 15) & 0x1])
+
+    @property
+    def captured_piece(self) -> Optional[Piece]:
+        """Piece captured by this move, or None."""
+        if not (self.p & (1 << 16)):
+            return None
+        return Piece(_PIECE_TYPES[(self.p >> 17) & 0x7], _COLORS[(self.p >> 20) & 0x1])
+
+    @property
+    def promotion_piece(self) -> Optional[PieceType]:
+        """Piece type for pawn promotion, or None."""
+        if not (self.p & (1 << 21)):
+            return None
+        return _PIECE_TYPES[(self.p >> 22) & 0x7]
+
+    @promotion_piece.setter
+    def promotion_piece(self, piece_type: Optional[PieceType]) -> None:
+        self.p &= ~((1 << 21) | (0x7 << 22))
+        if piece_type is not None:
+            self.p |= (1 << 21) | (_TYPE_INDEX[piece_type] << 22)
+
+    @property
+    def is_castling(self) -> bool:
+        """Whether this move is a castling move."""
+        return bool(self.p & (1 << 25))
+
+    @property
+    def is_en_passant(self) -> bool:
+        """Whether this move is an en passant capture."""
+        return bool(self.p & (1 << 26))
+
     def __eq__(self, other) -> bool:
         """Check equality with another Move."""
         if not isinstance(other, Move):
             return False
-        return (
-            self.from_square == other.from_square and
-            self.to_square == other.to_square and
-            self.piece == other.piece and
-            self.captured_piece == other.captured_piece and
-            self.promotion_piece == other.promotion_piece and
-            self.is_castling == other.is_castling and
-            self.is_en_passant == other.is_en_passant
-        )
-    
+        return self.p == other.p
+
     def __hash__(self) -> int:
         """Hash for use in sets and dictionaries."""
-        return hash((
-            self.from_square,
-            self.to_square,
-            self.piece,
-            self.captured_piece,
-            self.promotion_piece,
-            self.is_castling,
-            self.is_en_passant
-        ))
-    
+        return self.p
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
             f"Move({self.from_square.to_algebraic()} -> {self.to_square.to_algebraic()}, "
             f"{self.piece})"
         )
-    
-    def to_algebraic_notation(self, game_state=None, is_check: bool = False, is_checkmate: bool = False, 
+
+    def to_algebraic_notation(self, game_state=None, is_check: bool = False, is_checkmate: bool = False,
                               disambiguate_file: bool = False, disambiguate_rank: bool = False) -> str:
         """
         Convert move to standard algebraic notation.
-        
+
         Handles:
         - Piece notation (K, Q, R, B, N, or empty for pawns)
         - Capture notation (x)
@@ -84,83 +183,61 @@ class Move:
         - Castling notation (O-O, O-O-O)
         - Pawn promotion notation (=Q, =R, =B, =N)
         - Disambiguation when multiple pieces can move to same square
-        
+
         Args:
             game_state: Optional game state for determining check/checkmate
             is_check: Whether the move results in check
             is_checkmate: Whether the move results in checkmate
             disambiguate_file: Whether to include file for disambiguation
             disambiguate_rank: Whether to include rank for disambiguation
-        
+
         Returns:
             Algebraic notation string (e.g., "e4", "Nf3", "O-O", "exd5+")
-        
+
         Requirements: 8.2, 8.3, 8.4, 8.5
         """
-        # Handle castling notation (Requirement 8.2)
+        suffix = _CHECK_SUFFIX[(is_checkmate << 1) | is_check]
+
+        # Handle castling notation (Requirements 8.2, 8.5); kingside when
+        # the king lands on the g-file, queenside on the c-file
         if self.is_castling:
-            # Kingside castling: king moves to g-file
-            if self.to_square.file == 6:
-                notation = "O-O"
-            # Queenside castling: king moves to c-file
-            else:
-                notation = "O-O-O"
-            
-            # Add check/checkmate notation (Requirement 8.5)
-            if is_checkmate:
-                notation += "#"
-            elif is_check:
-                notation += "+"
-            
-            return notation
-        
-        # Start building the notation
-        notation = ""
-        
+            return _CASTLE_NOTATION[self.to_square.file == 6] + suffix
+
+        # Build the notation as a list of parts joined once at the end,
+        # avoiding an intermediate string per concatenation
+        parts = []
+        packed = self.p
+        piece_type = _PIECE_TYPES[(packed >> 12) & 0x7]
+        is_capture = bool(packed & ((1 << 16) | (1 << 26)))
+        from_file = packed & 0x7
+
         # Add piece notation (Requirement 8.2)
         # Pawns have no piece letter, other pieces use uppercase letter
-        if self.piece.piece_type == PieceType.PAWN:
+        if piece_type == PieceType.PAWN:
             # For pawn captures, include the starting file
-            if self.captured_piece is not None or self.is_en_passant:
-                notation += chr(ord('a') + self.from_square.file)
+            if is_capture:
+                parts.append('abcdefgh'[from_file])
         else:
-            # Map piece types to their notation letters
-            piece_letters = {
-                PieceType.KNIGHT: 'N',
-                PieceType.BISHOP: 'B',
-                PieceType.ROOK: 'R',
-                PieceType.QUEEN: 'Q',
-                PieceType.KING: 'K'
-            }
-            notation += piece_letters[self.piece.piece_type]
-            
+            parts.append(_PIECE_LETTER[piece_type])
+
             # Add disambiguation if needed (Requirement 8.2)
             if disambiguate_file:
-                notation += chr(ord('a') + self.from_square.file)
+                parts.append('abcdefgh'[from_file])
             if disambiguate_rank:
-                notation += str(self.from_square.rank + 1)
-        
+                parts.append(str(((packed >> 3) & 0x7) + 1))
+
         # Add capture notation (Requirement 8.4)
-        if self.captured_piece is not None or self.is_en_passant:
-            notation += "x"
-        
+        if is_capture:
+            parts.append("x")
+
         # Add destination square (Requirement 8.2)
-        notation += self.to_square.to_algebraic()
-        
+        parts.append(self.to_square.to_algebraic())
+
         # Add promotion notation (Requirement 8.2)
-        if self.promotion_piece is not None:
-            promotion_letters = {
-                PieceType.KNIGHT: 'N',
-                PieceType.BISHOP: 'B',
-                PieceType.ROOK: 'R',
-                PieceType.QUEEN: 'Q'
-            }
-            notation += "=" + promotion_letters[self.promotion_piece]
-        
+        if packed & (1 << 21):
+            parts.append(_PROMO_LETTER[_PIECE_TYPES[(packed >> 22) & 0x7]])
+
         # Add check/checkmate notation (Requirement 8.5)
-        if is_checkmate:
-            notation += "#"
-        elif is_check:
-            notation += "+"
-        
-        return notation
+        parts.append(suffix)
+
+        return ''.join(parts)
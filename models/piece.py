@@ -24,29 +24,28 @@ class Color(Enum):
 
 
 class Piece:
-    """Represents a chess piece with type and color."""
-    
-    def __init__(self, piece_type: PieceType, color: Color):
-        """
-        Initialize a piece.
-        
-        Args:
-            piece_type: Type of the piece
-            color: Color of the piece
-        """
-        self.piece_type = piece_type
-        self.color = color
-    
-    def __eq__(self, other) -> bool:
-        """Check equality with another Piece."""
-        if not isinstance(other, Piece):
-            return False
-        return self.piece_type == other.piece_type and self.color == other.color
-    
-    def __hash__(self) -> int:
-        """Hash for use in sets and dictionaries."""
-        return hash((self.piece_type, self.color))
-    
+    """
+    Represents a chess piece with type and color.
+
+    There are only 12 distinct (type, color) combinations, so instances
+    are interned: constructing a Piece returns the shared flyweight for
+    that combination instead of allocating a new object each time. The
+    cache is fully populated when the class is defined, the instances
+    are immutable, and equality/hashing are plain object identity.
+    """
+
+    __slots__ = ('piece_type', 'color')
+
+    _cache = {}
+
+    def __new__(cls, piece_type: PieceType, color: Color):
+        """Return the interned instance for this (type, color) pair."""
+        return cls._cache[(piece_type, color)]
+
+    def __setattr__(self, name, value):
+        """Reject mutation: the 12 flyweights are shared everywhere."""
+        raise AttributeError("Piece instances are immutable")
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"Piece({self.color.value} {self.piece_type.value})"
@@ -68,3 +67,13 @@ class Piece:
         }
         symbol = symbols[self.piece_type]
         return symbol if self.color == Color.WHITE else symbol.lower()
+
+
+# Populate the flyweight cache with all 12 (type, color) combinations
+for _piece_type in PieceType:
+    for _color in Color:
+        _piece = object.__new__(Piece)
+        object.__setattr__(_piece, 'piece_type', _piece_type)
+        object.__setattr__(_piece, 'color', _color)
+        Piece._cache[(_piece_type, _color)] = _piece
+del _piece_type, _color, _piece
@@ -1,19 +1,26 @@
 """Square representation with algebraic notation conversion."""
 
-from typing import Optional
-
 
 class Square:
-    """Represents a square on the chess board using file (0-7) and rank (0-7)."""
-    
-    def __init__(self, file: int, rank: int):
+    """
+    Represents a square on the chess board using file (0-7) and rank (0-7).
+
+    Internally a square is just its index 0-63 (rank * 8 + file); file
+    and rank are decoded on demand. All 64 instances are interned, so
+    constructing a Square returns a shared object and equality/hashing
+    are plain object identity.
+    """
+
+    __slots__ = ('index',)
+
+    def __new__(cls, file: int, rank: int):
         """
-        Initialize a square with file and rank coordinates.
-        
+        Return the interned square for the given coordinates.
+
         Args:
             file: Column index (0-7 representing a-h)
             rank: Row index (0-7 representing 1-8)
-        
+
         Raises:
             ValueError: If file or rank is out of bounds
         """
@@ -21,61 +28,85 @@ class Square:
             raise ValueError(f"File must be between 0 and 7, got {file}")
         if not (0 <= rank <= 7):
             raise ValueError(f"Rank must be between 0 and 7, got {rank}")
-        
-        self.file = file
-        self.rank = rank
-    
+
+        return _SQUARES[rank * 8 + file]
+
+    def __setattr__(self, name, value):
+        """Reject mutation: the 64 interned squares are shared everywhere."""
+        raise AttributeError("Square instances are immutable")
+
+    @property
+    def file(self) -> int:
+        """Column index (0-7 representing a-h)."""
+        return self.index & 7
+
+    @property
+    def rank(self) -> int:
+        """Row index (0-7 representing 1-8)."""
+        return self.index >> 3
+
     @classmethod
     def from_algebraic(cls, notation: str) -> 'Square':
         """
         Create a Square from algebraic notation (e.g., 'e4').
-        
+
         Args:
             notation: Algebraic notation string (e.g., 'a1', 'h8')
-        
+
         Returns:
             Square instance
-        
+
         Raises:
             ValueError: If notation is invalid
         """
+        # Fast path: all 64 valid names are precomputed, so canonical
+        # lowercase input resolves with a single dict lookup before any
+        # slicing or case folding
+        square = _NAME_TO_SQUARE.get(notation)
+        if square is not None:
+            return square
+
         if len(notation) != 2:
             raise ValueError(f"Algebraic notation must be 2 characters, got '{notation}'")
-        
+
         file_char = notation[0].lower()
         rank_char = notation[1]
-        
+
+        square = _NAME_TO_SQUARE.get(file_char + rank_char)
+        if square is not None:
+            return square
+
         if file_char not in 'abcdefgh':
             raise ValueError(f"File must be a-h, got '{file_char}'")
-        if rank_char not in '12345678':
-            raise ValueError(f"Rank must be 1-8, got '{rank_char}'")
-        
-        file = ord(file_char) - ord('a')
-        rank = int(rank_char) - 1
-        
-        return cls(file, rank)
-    
+        raise ValueError(f"Rank must be 1-8, got '{rank_char}'")
+
     def to_algebraic(self) -> str:
         """
         Convert square to algebraic notation.
-        
+
         Returns:
             Algebraic notation string (e.g., 'e4')
         """
-        file_char = chr(ord('a') + self.file)
-        rank_char = str(self.rank + 1)
-        return file_char + rank_char
-    
-    def __eq__(self, other) -> bool:
-        """Check equality with another Square."""
-        if not isinstance(other, Square):
-            return False
-        return self.file == other.file and self.rank == other.rank
-    
-    def __hash__(self) -> int:
-        """Hash for use in sets and dictionaries."""
-        return hash((self.file, self.rank))
-    
+        return _ALGEBRAIC_NAMES[self.index]
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"Square({self.to_algebraic()})"
+
+
+# The 64 interned squares (indexed by rank * 8 + file), the memoized
+# algebraic name for each, and the reverse mapping from name straight to
+# the interned instance, so both conversions are table lookups.
+_SQUARES = []
+for _index in range(64):
+    _square = object.__new__(Square)
+    object.__setattr__(_square, 'index', _index)
+    _SQUARES.append(_square)
+del _index, _square
+
+_ALGEBRAIC_NAMES = tuple(
+    f"{'abcdefgh'[index % 8]}{index // 8 + 1}" for index in range(64)
+)
+_NAME_TO_SQUARE = {
+    name: _SQUARES[index] for index, name in enumerate(_ALGEBRAIC_NAMES)
+}
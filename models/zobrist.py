@@ -0,0 +1,26 @@
+"""Zobrist hashing tables for incremental position hashing.
+
+The tables are filled once at import from a fixed-seed PRNG so hashes are
+stable within and across runs. A position hash is the XOR of one key per
+piece-on-square, plus side-to-move, castling-rights and en-passant-file
+keys; placing or removing a piece updates the hash with a single XOR.
+"""
+
+import random
+
+_rng = random.Random(0xC0FFEE)
+
+# One 64-bit key per (piece index, square); piece index is
+# type_index * 2 + color_index, matching Board's bitboard layout
+ZOBRIST_PIECES = [
+    [_rng.getrandbits(64) for _ in range(64)] for _ in range(12)
+]
+
+# XORed in when black is to move
+ZOBRIST_SIDE = _rng.getrandbits(64)
+
+# One key per packed castling-rights bitmask (16 combinations)
+ZOBRIST_CASTLING = [_rng.getrandbits(64) for _ in range(16)]
+
+# One key per en passant file
+ZOBRIST_EP = [_rng.getrandbits(64) for _ in range(8)]
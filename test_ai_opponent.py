@@ -1,18 +1,14 @@
 """Tests for AI opponent functionality."""
 
 import pytest
-from ai.ai_opponent import AIOpponent
-from engine.chess_engine import ChessEngine
 from models.game_state import GameState, GameMode
 from models.piece import Color, PieceType, Piece
 from models.square import Square
 from models.board import Board
 
 
-def test_ai_selects_legal_move():
+def test_ai_selects_legal_move(engine, ai):
     """Test that AI only selects from legal moves."""
-    engine = ChessEngine()
-    ai = AIOpponent(engine)
     
     # Create a new game
     state = GameState.new_game(GameMode.SINGLE_PLAYER)
@@ -28,10 +24,8 @@ def test_ai_selects_legal_move():
     assert move in legal_moves
 
 
-def test_ai_evaluates_material():
+def test_ai_evaluates_material(engine, ai):
     """Test that AI correctly evaluates material."""
-    engine = ChessEngine()
-    ai = AIOpponent(engine)
     
     # Create a position where white has more material
     board = Board()
@@ -56,10 +50,8 @@ def test_ai_evaluates_material():
     assert score == -9
 
 
-def test_ai_finds_checkmate_in_one():
+def test_ai_finds_checkmate_in_one(engine, ai):
     """Test that AI finds checkmate in one move."""
-    engine = ChessEngine()
-    ai = AIOpponent(engine)
     
     # Set up a position where white can checkmate in one
     # Back rank mate: white queen on d8, black king on e8, black rook on a8
@@ -92,10 +84,8 @@ def test_ai_finds_checkmate_in_one():
         assert engine.is_checkmate(new_state)
 
 
-def test_ai_returns_none_when_no_legal_moves():
+def test_ai_returns_none_when_no_legal_moves(engine, ai):
     """Test that AI returns None when there are no legal moves."""
-    engine = ChessEngine()
-    ai = AIOpponent(engine)
     
     # Set up a stalemate position
     board = Board()
@@ -116,10 +106,8 @@ def test_ai_returns_none_when_no_legal_moves():
     assert move is None
 
 
-def test_ai_material_evaluation_consistency():
+def test_ai_material_evaluation_consistency(engine, ai):
     """Test that positions with more material have higher evaluation."""
-    engine = ChessEngine()
-    ai = AIOpponent(engine)
     
     # Position 1: King only
     board1 = Board()
@@ -7,7 +7,6 @@ from models.move import Move
 from models.board import Board
 from models.game_state import GameState
 from models.castling_rights import CastlingRights
-from engine.chess_engine import ChessEngine
 
 
 def test_requirement_8_2_piece_notation():
@@ -160,12 +159,11 @@ def test_requirement_8_2_disambiguation():
     assert knight_both.to_algebraic_notation(disambiguate_file=True, disambiguate_rank=True) == "Na1c3"
 
 
-def test_requirement_8_3_chronological_order():
+def test_requirement_8_3_chronological_order(engine):
     """
     Requirement 8.3: Display moves in chronological order.
     Test that move history maintains order.
     """
-    engine = ChessEngine()
     state = GameState.new_game()
     
     # Make a sequence of moves
@@ -271,9 +269,8 @@ def test_requirement_8_5_check_and_checkmate_notation():
     assert capture_checkmate.to_algebraic_notation(is_checkmate=True) == "Nxe5#"
 
 
-def test_engine_disambiguation_detection():
+def test_engine_disambiguation_detection(engine):
     """Test that the engine correctly detects when disambiguation is needed."""
-    engine = ChessEngine()
     
     # Create a position where two rooks can move to the same square
     # Place rooks on a4 and h4, both can move to d4
@@ -7,7 +7,6 @@ from models.move import Move
 from models.board import Board
 from models.game_state import GameState
 from models.castling_rights import CastlingRights
-from engine.chess_engine import ChessEngine
 
 
 def test_pawn_move():
@@ -172,9 +171,8 @@ def test_disambiguation_by_both():
     assert notation == "Na1c3"
 
 
-def test_engine_algebraic_notation_with_check():
+def test_engine_algebraic_notation_with_check(engine):
     """Test engine's algebraic notation generation with check detection."""
-    engine = ChessEngine()
     state = GameState.new_game()
     
     # Move pawn e2-e4
@@ -87,14 +87,10 @@ def test_is_legal_move_invalid():
     """Test checking if a move that would leave king in check is illegal."""
     engine = ChessEngine()
     
-    # Create a position where moving a piece would leave king in check
-    state = GameState.new_game(GameMode.MULTIPLAYER)
-    
-    # Clear the board
-    for rank in range(8):
-        for file in range(8):
-            state.board.remove_piece(Square(file, rank))
-    
+    # Create a position where moving a piece would leave king in check,
+    # starting from an empty board
+    state = GameState.new_game(GameMode.MULTIPLAYER, starting_position=False)
+
     # Set up: white king on e1, white bishop on d2, black rook on a1
     # If bishop moves, king will be in check from rook
     from models.piece import Piece
@@ -118,14 +114,10 @@ def test_get_legal_moves_filters_check():
     """Test that get_legal_moves filters out moves that leave king in check."""
     engine = ChessEngine()
     
-    # Create a position where white king is in check
-    state = GameState.new_game(GameMode.MULTIPLAYER)
-    
-    # Clear the board
-    for rank in range(8):
-        for file in range(8):
-            state.board.remove_piece(Square(file, rank))
-    
+    # Create a position where white king is in check, starting from an
+    # empty board
+    state = GameState.new_game(GameMode.MULTIPLAYER, starting_position=False)
+
     # Set up a position: white king on e1, black rook on e8
     from models.piece import Piece
     state.board.set_piece(Square(4, 0), Piece(PieceType.KING, Color.WHITE))
@@ -44,17 +44,15 @@ def test_new_game_initialization():
     assert state.board.get_piece(Square.from_algebraic('g1')).piece_type == PieceType.KNIGHT
     assert state.board.get_piece(Square.from_algebraic('h1')).piece_type == PieceType.ROOK
     
-    # Check white pawns on rank 2
-    for file in 'abcdefgh':
-        square = Square.from_algebraic(f'{file}2')
-        piece = state.board.get_piece(square)
+    # Check white pawns on rank 2 (rank index 1)
+    for file in range(8):
+        piece = state.board.get_piece(Square(file, 1))
         assert piece.piece_type == PieceType.PAWN
         assert piece.color == Color.WHITE
-    
-    # Check black pawns on rank 7
-    for file in 'abcdefgh':
-        square = Square.from_algebraic(f'{file}7')
-        piece = state.board.get_piece(square)
+
+    # Check black pawns on rank 7 (rank index 6)
+    for file in range(8):
+        piece = state.board.get_piece(Square(file, 6))
         assert piece.piece_type == PieceType.PAWN
         assert piece.color == Color.BLACK
     
@@ -7,12 +7,10 @@ from models.move import Move
 from models.piece import Piece, PieceType, Color
 from models.square import Square
 from models.castling_rights import CastlingRights
-from engine.chess_engine import ChessEngine
 
 
-def test_execute_normal_move():
+def test_execute_normal_move(engine):
     """Test executing a normal piece move."""
-    engine = ChessEngine()
     state = GameState.new_game()
     
     # Move white pawn from e2 to e4
@@ -37,9 +35,8 @@ def test_execute_normal_move():
     assert new_state.move_history[0] == move
 
 
-def test_execute_capture():
+def test_execute_capture(engine):
     """Test executing a capture move."""
-    engine = ChessEngine()
     board = Board()
     
     # Set up a simple position with a capture
@@ -71,9 +68,8 @@ def test_execute_capture():
     assert new_state.halfmove_clock == 0
 
 
-def test_execute_pawn_promotion():
+def test_execute_pawn_promotion(engine):
     """Test executing a pawn promotion."""
-    engine = ChessEngine()
     board = Board()
     
     # White pawn on 7th rank ready to promote
@@ -102,9 +98,8 @@ def test_execute_pawn_promotion():
     assert promoted_piece.color == Color.WHITE
 
 
-def test_execute_castling_kingside():
+def test_execute_castling_kingside(engine):
     """Test executing kingside castling."""
-    engine = ChessEngine()
     board = Board()
     
     # Set up position for white kingside castling
@@ -136,9 +131,8 @@ def test_execute_castling_kingside():
     assert new_state.board.get_piece(Square.from_algebraic("f1")).piece_type == PieceType.ROOK
 
 
-def test_execute_castling_queenside():
+def test_execute_castling_queenside(engine):
     """Test executing queenside castling."""
-    engine = ChessEngine()
     board = Board()
     
     # Set up position for black queenside castling
@@ -170,9 +164,8 @@ def test_execute_castling_queenside():
     assert new_state.board.get_piece(Square.from_algebraic("d8")).piece_type == PieceType.ROOK
 
 
-def test_execute_en_passant():
+def test_execute_en_passant(engine):
     """Test executing an en passant capture."""
-    engine = ChessEngine()
     board = Board()
     
     # Set up position for en passant
@@ -206,9 +199,8 @@ def test_execute_en_passant():
     assert new_state.board.get_piece(Square.from_algebraic("d5")) is None
 
 
-def test_castling_rights_revoked_on_king_move():
+def test_castling_rights_revoked_on_king_move(engine):
     """Test that castling rights are revoked when king moves."""
-    engine = ChessEngine()
     board = Board()
     
     board.set_piece(Square.from_algebraic("e1"), Piece(PieceType.KING, Color.WHITE))
@@ -233,9 +225,8 @@ def test_castling_rights_revoked_on_king_move():
     assert new_state.castling_rights.white_queenside is False
 
 
-def test_castling_rights_revoked_on_rook_move():
+def test_castling_rights_revoked_on_rook_move(engine):
     """Test that castling rights are revoked when rook moves."""
-    engine = ChessEngine()
     board = Board()
     
     board.set_piece(Square.from_algebraic("h1"), Piece(PieceType.ROOK, Color.WHITE))
@@ -260,9 +251,8 @@ def test_castling_rights_revoked_on_rook_move():
     assert new_state.castling_rights.white_queenside is True
 
 
-def test_castling_rights_revoked_on_rook_capture():
+def test_castling_rights_revoked_on_rook_capture(engine):
     """Test that castling rights are revoked when rook is captured."""
-    engine = ChessEngine()
     board = Board()
     
     # Black rook on h8, white bishop can capture it
@@ -290,9 +280,8 @@ def test_castling_rights_revoked_on_rook_capture():
     assert new_state.castling_rights.black_queenside is True
 
 
-def test_en_passant_target_set_on_two_square_pawn_move():
+def test_en_passant_target_set_on_two_square_pawn_move(engine):
     """Test that en passant target is set when pawn moves two squares."""
-    engine = ChessEngine()
     state = GameState.new_game()
     
     # Move white pawn two squares
@@ -308,9 +297,8 @@ def test_en_passant_target_set_on_two_square_pawn_move():
     assert new_state.en_passant_target == Square.from_algebraic("e3")
 
 
-def test_en_passant_target_cleared_on_other_moves():
+def test_en_passant_target_cleared_on_other_moves(engine):
     """Test that en passant target is cleared on non-two-square pawn moves."""
-    engine = ChessEngine()
     board = Board()
     
     board.set_piece(Square.from_algebraic("e4"), Piece(PieceType.KNIGHT, Color.WHITE))
@@ -335,57 +323,42 @@ def test_en_passant_target_cleared_on_other_moves():
     assert new_state.en_passant_target is None
 
 
-def test_halfmove_clock_increments():
-    """Test that halfmove clock increments on non-pawn, non-capture moves."""
-    engine = ChessEngine()
+@pytest.mark.parametrize(
+    "piece_type,from_name,to_name,start_clock,expected_clock",
+    [
+        # Non-pawn, non-capture move increments the clock
+        (PieceType.KNIGHT, "e4", "f6", 3, 4),
+        # Pawn move resets the clock
+        (PieceType.PAWN, "e2", "e4", 10, 0),
+    ],
+    ids=["increments_on_quiet_move", "resets_on_pawn_move"]
+)
+def test_halfmove_clock(engine, piece_type, from_name, to_name, start_clock, expected_clock):
+    """Test halfmove clock updates on quiet moves and pawn moves."""
     board = Board()
-    
-    board.set_piece(Square.from_algebraic("e4"), Piece(PieceType.KNIGHT, Color.WHITE))
-    
+    piece = Piece(piece_type, Color.WHITE)
+    board.set_piece(Square.from_algebraic(from_name), piece)
+
     state = GameState(
         board=board,
         current_player=Color.WHITE,
         castling_rights=CastlingRights(),
-        halfmove_clock=3
-    )
-    
-    # Move knight
-    move = Move(
-        from_square=Square.from_algebraic("e4"),
-        to_square=Square.from_algebraic("f6"),
-        piece=Piece(PieceType.KNIGHT, Color.WHITE)
+        halfmove_clock=start_clock
     )
-    
-    new_state = engine.execute_move(state, move)
-    
-    # Check halfmove clock incremented
-    assert new_state.halfmove_clock == 4
 
-
-def test_halfmove_clock_resets_on_pawn_move():
-    """Test that halfmove clock resets on pawn moves."""
-    engine = ChessEngine()
-    state = GameState.new_game()
-    
-    # Manually set halfmove clock
-    state.halfmove_clock = 10
-    
-    # Move pawn
     move = Move(
-        from_square=Square.from_algebraic("e2"),
-        to_square=Square.from_algebraic("e4"),
-        piece=Piece(PieceType.PAWN, Color.WHITE)
+        from_square=Square.from_algebraic(from_name),
+        to_square=Square.from_algebraic(to_name),
+        piece=piece
     )
-    
+
     new_state = engine.execute_move(state, move)
-    
-    # Check halfmove clock reset
-    assert new_state.halfmove_clock == 0
+
+    assert new_state.halfmove_clock == expected_clock
 
 
-def test_fullmove_number_increments_after_black_move():
+def test_fullmove_number_increments_after_black_move(engine):
     """Test that fullmove number increments after black's move."""
-    engine = ChessEngine()
     board = Board()
     
     board.set_piece(Square.from_algebraic("e4"), Piece(PieceType.PAWN, Color.BLACK))
@@ -410,9 +383,8 @@ def test_fullmove_number_increments_after_black_move():
     assert new_state.fullmove_number == 6
 
 
-def test_fullmove_number_unchanged_after_white_move():
+def test_fullmove_number_unchanged_after_white_move(engine):
     """Test that fullmove number doesn't increment after white's move."""
-    engine = ChessEngine()
     state = GameState.new_game()
     
     # White moves
@@ -428,9 +400,8 @@ def test_fullmove_number_unchanged_after_white_move():
     assert new_state.fullmove_number == 1
 
 
-def test_position_history_updated():
+def test_position_history_updated(engine):
     """Test that position history is updated after move."""
-    engine = ChessEngine()
     state = GameState.new_game()
     
     initial_history_length = len(state.position_history)
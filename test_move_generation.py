@@ -1,5 +1,7 @@
 """Basic tests for move generation functionality."""
 
+import pytest
+
 from models.game_state import GameState, GameMode
 from models.piece import Color, PieceType, Piece
 from models.square import Square
@@ -7,13 +9,22 @@ from models.board import Board
 from engine.move_generator import MoveGenerator
 
 
-def test_pawn_initial_moves():
+@pytest.fixture(scope='module')
+def start_state():
+    """Shared starting position for read-only tests.
+
+    Module-scoped, so it is built once per run; tests that mutate the
+    position must work on ``start_state.copy()`` instead.
+    """
+    return GameState.new_game()
+
+
+def test_pawn_initial_moves(start_state):
     """Test that pawns can move one or two squares from starting position."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White pawn on e2
-    e2_moves = generator.generate_piece_moves(state, Square.from_algebraic('e2'))
+    e2_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('e2'))
     
     # Should have 2 moves: e3 and e4
     assert len(e2_moves) == 2
@@ -22,13 +33,12 @@ def test_pawn_initial_moves():
     print("✓ Pawn initial moves test passed")
 
 
-def test_knight_moves():
+def test_knight_moves(start_state):
     """Test knight movement from starting position."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White knight on b1
-    b1_moves = generator.generate_piece_moves(state, Square.from_algebraic('b1'))
+    b1_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('b1'))
     
     # Should have 2 moves: a3 and c3 (d2 is blocked by pawn)
     assert len(b1_moves) == 2
@@ -37,53 +47,49 @@ def test_knight_moves():
     print("✓ Knight moves test passed")
 
 
-def test_bishop_blocked():
+def test_bishop_blocked(start_state):
     """Test that bishops are blocked by pawns at start."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White bishop on c1 - should have no moves (blocked by pawns)
-    c1_moves = generator.generate_piece_moves(state, Square.from_algebraic('c1'))
+    c1_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('c1'))
     assert len(c1_moves) == 0
     print("✓ Bishop blocked test passed")
 
 
-def test_rook_blocked():
+def test_rook_blocked(start_state):
     """Test that rooks are blocked by pawns at start."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White rook on a1 - should have no moves (blocked by pawn)
-    a1_moves = generator.generate_piece_moves(state, Square.from_algebraic('a1'))
+    a1_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('a1'))
     assert len(a1_moves) == 0
     print("✓ Rook blocked test passed")
 
 
-def test_queen_blocked():
+def test_queen_blocked(start_state):
     """Test that queen is blocked at start."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White queen on d1 - should have no moves (blocked by pawns)
-    d1_moves = generator.generate_piece_moves(state, Square.from_algebraic('d1'))
+    d1_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('d1'))
     assert len(d1_moves) == 0
     print("✓ Queen blocked test passed")
 
 
-def test_king_initial_moves():
+def test_king_initial_moves(start_state):
     """Test that king has no moves at start (blocked by pieces)."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
     # White king on e1 - should have no moves (blocked by pieces)
-    e1_moves = generator.generate_piece_moves(state, Square.from_algebraic('e1'))
+    e1_moves = generator.generate_piece_moves(start_state, Square.from_algebraic('e1'))
     assert len(e1_moves) == 0
     print("✓ King initial moves test passed")
 
 
-def test_bishop_open_board():
+def test_bishop_open_board(start_state):
     """Test bishop moves on open board."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Clear the board and place a bishop
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('d4'), Piece(PieceType.BISHOP, Color.WHITE))
@@ -96,9 +102,9 @@ def test_bishop_open_board():
     print("✓ Bishop open board test passed")
 
 
-def test_rook_open_board():
+def test_rook_open_board(start_state):
     """Test rook moves on open board."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Clear the board and place a rook
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('d4'), Piece(PieceType.ROOK, Color.WHITE))
@@ -111,9 +117,9 @@ def test_rook_open_board():
     print("✓ Rook open board test passed")
 
 
-def test_queen_open_board():
+def test_queen_open_board(start_state):
     """Test queen moves on open board."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Clear the board and place a queen
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('d4'), Piece(PieceType.QUEEN, Color.WHITE))
@@ -126,9 +132,9 @@ def test_queen_open_board():
     print("✓ Queen open board test passed")
 
 
-def test_pawn_capture():
+def test_pawn_capture(start_state):
     """Test pawn diagonal captures."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Clear some squares and set up a capture scenario
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('e4'), Piece(PieceType.PAWN, Color.WHITE))
@@ -149,16 +155,16 @@ def test_pawn_capture():
     print("✓ Pawn capture test passed")
 
 
-def test_castling_kingside_white():
+def test_castling_kingside_white(start_state):
     """Test white kingside castling generation."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Clear squares between king and rook
     state.board.remove_piece(Square.from_algebraic('f1'))
     state.board.remove_piece(Square.from_algebraic('g1'))
     
     generator = MoveGenerator()
     moves = generator.generate_piece_moves(state, Square.from_algebraic('e1'))
-    
+
     # Should include castling move to g1
     castling_moves = [m for m in moves if m.is_castling]
     assert len(castling_moves) == 1
@@ -166,9 +172,9 @@ def test_castling_kingside_white():
     print("✓ White kingside castling test passed")
 
 
-def test_en_passant():
+def test_en_passant(start_state):
     """Test en passant capture generation."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Set up en passant scenario
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('e5'), Piece(PieceType.PAWN, Color.WHITE))
@@ -185,9 +191,9 @@ def test_en_passant():
     print("✓ En passant test passed")
 
 
-def test_pawn_promotion():
+def test_pawn_promotion(start_state):
     """Test pawn promotion move generation."""
-    state = GameState.new_game()
+    state = start_state.copy()
     # Place white pawn on 7th rank
     state.board = Board()
     state.board.set_piece(Square.from_algebraic('e7'), Piece(PieceType.PAWN, Color.WHITE))
@@ -202,12 +208,11 @@ def test_pawn_promotion():
     print("✓ Pawn promotion test passed")
 
 
-def test_generate_all_moves_initial():
+def test_generate_all_moves_initial(start_state):
     """Test generating all moves for white at start."""
-    state = GameState.new_game()
     generator = MoveGenerator()
     
-    moves = generator.generate_pseudo_legal_moves(state, Color.WHITE)
+    moves = generator.generate_pseudo_legal_moves(start_state, Color.WHITE)
     
     # At start, white has 20 possible moves:
     # 8 pawns × 2 moves each = 16
@@ -217,19 +222,4 @@ def test_generate_all_moves_initial():
 
 
 if __name__ == '__main__':
-    test_pawn_initial_moves()
-    test_knight_moves()
-    test_bishop_blocked()
-    test_rook_blocked()
-    test_queen_blocked()
-    test_king_initial_moves()
-    test_bishop_open_board()
-    test_rook_open_board()
-    test_queen_open_board()
-    test_pawn_capture()
-    test_castling_kingside_white()
-    test_en_passant()
-    test_pawn_promotion()
-    test_generate_all_moves_initial()
-    
-    print("\n✅ All move generation tests passed!")
+    pytest.main([__file__])
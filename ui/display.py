@@ -1,11 +1,91 @@
 """UI display component for rendering the chess board and game state."""
 
-from typing import Optional, List, Set
+from typing import Optional, List
 from models.game_state import GameState
 from models.square import Square
 from models.move import Move
-from models.piece import Color, PieceType
-from engine.check_detector import CheckDetector
+from models.piece import Color, Piece, PieceType
+
+
+# CheckDetector is stateless, so every display shares one instance. It
+# is imported and built on first use: loading this module (or rendering
+# prompts and errors) then never pulls in the engine's attack tables
+_CHECK_DETECTOR = None
+
+
+def _get_check_detector():
+    """Return the shared CheckDetector, creating it on first use."""
+    global _CHECK_DETECTOR
+    if _CHECK_DETECTOR is None:
+        from engine.check_detector import CheckDetector
+        _CHECK_DETECTOR = CheckDetector()
+    return _CHECK_DETECTOR
+
+
+# Fixed scaffolding, assembled once at import time so each render
+# concatenates a handful of prebuilt blocks instead of re-appending the
+# same banner lines
+_BANNER = "=" * 50
+_HEADER = _BANNER + "\nCHESS GAME\n" + _BANNER + "\n"
+_HISTORY_HEADER = "Move History:\n" + "-" * 50
+_GAME_OVER_TEMPLATE = _BANNER + "\nGAME OVER: {result}\n" + _BANNER
+_RANK_LABELS = tuple(f" {rank + 1} " for rank in range(8))
+_FILE_FOOTER = "    a  b  c  d  e  f  g  h"
+
+# Prompts whose text never changes (or only varies by color), built once
+_PROMOTION_PROMPT = "\n".join([
+    "",
+    _BANNER,
+    "PAWN PROMOTION",
+    _BANNER,
+    "Select promotion piece:",
+    "  Q - Queen",
+    "  R - Rook",
+    "  B - Bishop",
+    "  N - Knight",
+    ""
+])
+_MODE_PROMPT = "\n".join([
+    "",
+    _BANNER,
+    "CHESS GAME - MODE SELECTION",
+    _BANNER,
+    "Select game mode:",
+    "  1 - Single Player (vs AI)",
+    "  2 - Multiplayer (Human vs Human)",
+    ""
+])
+_MOVE_PROMPTS = {
+    color: f"\n{color.value.upper()}'s move (e.g., 'e2' to select, 'e4' to move): "
+    for color in Color
+}
+
+
+# Unicode chess symbols, keyed by the 12 interned Piece instances so a
+# board render is one dict hit per occupied square instead of building
+# the symbol tables anew each call
+_PIECE_SYMBOLS = {
+    Piece(PieceType.KING, Color.WHITE): "♔",
+    Piece(PieceType.QUEEN, Color.WHITE): "♕",
+    Piece(PieceType.ROOK, Color.WHITE): "♖",
+    Piece(PieceType.BISHOP, Color.WHITE): "♗",
+    Piece(PieceType.KNIGHT, Color.WHITE): "♘",
+    Piece(PieceType.PAWN, Color.WHITE): "♙",
+    Piece(PieceType.KING, Color.BLACK): "♚",
+    Piece(PieceType.QUEEN, Color.BLACK): "♛",
+    Piece(PieceType.ROOK, Color.BLACK): "♜",
+    Piece(PieceType.BISHOP, Color.BLACK): "♝",
+    Piece(PieceType.KNIGHT, Color.BLACK): "♞",
+    Piece(PieceType.PAWN, Color.BLACK): "♟",
+}
+
+# Every 3-wide cell string the grid can emit, prebuilt for the 13
+# possible characters (12 pieces plus empty) in each highlight state so
+# the render loop appends ready-made strings instead of formatting them
+_CELL_CHARS = (".",) + tuple(_PIECE_SYMBOLS.values())
+_CELLS_NORMAL = {char: f" {char} " for char in _CELL_CHARS}
+_CELLS_SELECTED = {char: f"[{char}]" for char in _CELL_CHARS}
+_CELLS_LEGAL = {char: f"*{char}*" for char in _CELL_CHARS}
 
 
 class ChessDisplay:
@@ -17,7 +97,16 @@ class ChessDisplay:
     
     def __init__(self):
         """Initialize the display component."""
-        self.check_detector = CheckDetector()
+        # Formatted move-history lines for complete move pairs, reused
+        # across renders as long as the history prefix they were built
+        # from is unchanged
+        self._history_moves: List[Move] = []
+        self._history_lines: List[str] = []
+
+    @property
+    def check_detector(self):
+        """The shared check detector, created lazily on first access."""
+        return _get_check_detector()
     
     def render_board(
         self,
@@ -40,14 +129,8 @@ class ChessDisplay:
         
         Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 8.2, 8.3
         """
-        output = []
-        
-        # Add title
-        output.append("=" * 50)
-        output.append("CHESS GAME")
-        output.append("=" * 50)
-        output.append("")
-        
+        output = [_HEADER]
+
         # Display current player's turn (Requirement 6.3)
         if game_result is None:
             turn_text = f"Current Turn: {state.current_player.value.upper()}"
@@ -59,90 +142,100 @@ class ChessDisplay:
             
             output.append("")
         
-        # Get legal move destinations for highlighting
-        legal_destinations = set()
+        # Get legal move destinations for highlighting, packed into a
+        # bitboard so the grid loop tests a single shift-and-mask,
+        # matching how the engine passes square sets around
+        dest_mask = 0
         if legal_moves:
-            legal_destinations = {move.to_square for move in legal_moves}
-        
+            for move in legal_moves:
+                dest_mask |= 1 << move.to_square.index
+        selected_index = selected_square.index if selected_square is not None else -1
+
         # Render the board (Requirements 6.1, 6.2, 6.4)
-        board_lines = self._render_board_grid(
+        output.append(self._render_board_grid(
             state,
-            selected_square,
-            legal_destinations
-        )
-        output.extend(board_lines)
+            selected_index,
+            dest_mask
+        ))
         output.append("")
-        
+
         # Display move history (Requirements 8.2, 8.3)
         if state.move_history:
-            output.append("Move History:")
-            output.append("-" * 50)
+            output.append(_HISTORY_HEADER)
             history_lines = self._render_move_history(state)
             output.extend(history_lines)
             output.append("")
-        
+
         # Display game result if game is over (Requirement 6.1)
         if game_result:
-            output.append("=" * 50)
-            output.append(f"GAME OVER: {game_result}")
-            output.append("=" * 50)
-        
+            output.append(_GAME_OVER_TEMPLATE.format(result=game_result))
+
         return "\n".join(output)
     
     def _render_board_grid(
         self,
         state: GameState,
-        selected_square: Optional[Square],
-        legal_destinations: Set[Square]
-    ) -> List[str]:
+        selected_index: int,
+        dest_mask: int
+    ) -> str:
         """
         Render the 8x8 chess board grid with pieces.
-        
+
+        Walks the board's mailbox rows directly so no Square objects are
+        materialized per cell; highlighting compares plain square
+        indices against an int and a destination bitboard.
+
         Args:
             state: Current game state
-            selected_square: Currently selected square
-            legal_destinations: Set of squares that are legal move destinations
-        
+            selected_index: Index of the selected square, or -1 for none
+            dest_mask: Bitboard of legal move destination squares
+
         Returns:
-            List of strings representing board lines
-        
+            The board grid as a single newline-joined string
+
         Requirements: 6.1, 6.2, 6.4
         """
         lines = []
-        
+        grid = state.board.grid
+        symbols = _PIECE_SYMBOLS
+
         # Render from rank 8 to rank 1 (top to bottom)
         for rank in range(7, -1, -1):
-            line_parts = [f" {rank + 1} "]
-            
+            line_parts = [_RANK_LABELS[rank]]
+            row = grid[rank]
+            rank_base = rank * 8
+
             for file in range(8):
-                square = Square(file, rank)
-                piece = state.board.get_piece(square)
-                
-                # Determine the display character for this square
+                piece = row[file]
+
+                # Determine the display character for this square; the
+                # symbol lookup is inlined rather than going through
+                # _get_piece_symbol to avoid 64 method calls per render
                 if piece is None:
                     # Empty square
                     char = "."
                 else:
                     # Display piece with clear white/black distinction (Requirement 6.2)
-                    char = self._get_piece_symbol(piece)
-                
+                    char = symbols[piece]
+
                 # Add highlighting for selected square and legal moves (Requirement 6.4)
-                if square == selected_square:
+                square_index = rank_base + file
+                if square_index == selected_index:
                     # Highlight selected piece with brackets
-                    line_parts.append(f"[{char}]")
-                elif square in legal_destinations:
+                    line_parts.append(_CELLS_SELECTED[char])
+                elif (dest_mask >> square_index) & 1:
                     # Highlight legal move destinations with asterisks
-                    line_parts.append(f"*{char}*")
+                    line_parts.append(_CELLS_LEGAL[char])
                 else:
                     # Normal display with spacing
-                    line_parts.append(f" {char} ")
-            
+                    line_parts.append(_CELLS_NORMAL[char])
+
             lines.append("".join(line_parts))
         
         # Add file labels at the bottom
-        lines.append("    a  b  c  d  e  f  g  h")
-        
-        return lines
+        lines.append(_FILE_FOOTER)
+
+        return "\n".join(lines)
     
     def _get_piece_symbol(self, piece) -> str:
         """
@@ -159,29 +252,7 @@ class ChessDisplay:
         
         Requirement 6.2: Clearly distinguish between white and black pieces
         """
-        # Unicode chess symbols
-        white_symbols = {
-            PieceType.KING: "♔",
-            PieceType.QUEEN: "♕",
-            PieceType.ROOK: "♖",
-            PieceType.BISHOP: "♗",
-            PieceType.KNIGHT: "♘",
-            PieceType.PAWN: "♙"
-        }
-        
-        black_symbols = {
-            PieceType.KING: "♚",
-            PieceType.QUEEN: "♛",
-            PieceType.ROOK: "♜",
-            PieceType.BISHOP: "♝",
-            PieceType.KNIGHT: "♞",
-            PieceType.PAWN: "♟"
-        }
-        
-        if piece.color == Color.WHITE:
-            return white_symbols[piece.piece_type]
-        else:
-            return black_symbols[piece.piece_type]
+        return _PIECE_SYMBOLS[piece]
     
     def _render_move_history(self, state: GameState) -> List[str]:
         """
@@ -195,26 +266,31 @@ class ChessDisplay:
         
         Requirements: 8.2, 8.3
         """
-        lines = []
-        
-        # Display moves in pairs (white move, black move)
-        for i in range(0, len(state.move_history), 2):
-            move_number = (i // 2) + 1
-            white_move = state.move_history[i]
-            
-            # Get algebraic notation for white's move
-            white_notation = self._get_move_notation(white_move)
-            
-            # Check if there's a black move
-            if i + 1 < len(state.move_history):
-                black_move = state.move_history[i + 1]
-                black_notation = self._get_move_notation(black_move)
-                line = f"{move_number:3d}. {white_notation:10s} {black_notation}"
-            else:
-                line = f"{move_number:3d}. {white_notation}"
-            
-            lines.append(line)
-        
+        history = state.move_history
+
+        # Lines for complete pairs are cached; reformat from scratch
+        # only if this render is for a different game (the cached prefix
+        # no longer matches, e.g. after a new game or an undo)
+        cached_moves = self._history_moves
+        if history[:len(cached_moves)] != cached_moves:
+            cached_moves = []
+            self._history_lines = []
+        lines = self._history_lines
+
+        # Format and cache any newly completed pairs (white move, black move)
+        i = len(cached_moves)
+        while i + 1 < len(history):
+            white_notation = self._get_move_notation(history[i])
+            black_notation = self._get_move_notation(history[i + 1])
+            lines.append(f"{(i // 2) + 1:3d}. {white_notation:10s} {black_notation}")
+            i += 2
+        self._history_moves = history[:i]
+
+        # A trailing white move without a reply is rendered fresh each
+        # time; its line changes once black answers
+        if i < len(history):
+            white_notation = self._get_move_notation(history[i])
+            return lines + [f"{(i // 2) + 1:3d}. {white_notation}"]
         return lines
     
     def _get_move_notation(self, move: Move) -> str:
@@ -244,19 +320,7 @@ class ChessDisplay:
         Returns:
             String prompting user to select promotion piece
         """
-        lines = [
-            "",
-            "=" * 50,
-            "PAWN PROMOTION",
-            "=" * 50,
-            "Select promotion piece:",
-            "  Q - Queen",
-            "  R - Rook",
-            "  B - Bishop",
-            "  N - Knight",
-            ""
-        ]
-        return "\n".join(lines)
+        return _PROMOTION_PROMPT
     
     def render_game_mode_prompt(self) -> str:
         """
@@ -265,17 +329,7 @@ class ChessDisplay:
         Returns:
             String prompting user to select game mode
         """
-        lines = [
-            "",
-            "=" * 50,
-            "CHESS GAME - MODE SELECTION",
-            "=" * 50,
-            "Select game mode:",
-            "  1 - Single Player (vs AI)",
-            "  2 - Multiplayer (Human vs Human)",
-            ""
-        ]
-        return "\n".join(lines)
+        return _MODE_PROMPT
     
     def render_move_prompt(self, current_player: Color) -> str:
         """
@@ -287,7 +341,7 @@ class ChessDisplay:
         Returns:
             String prompting user for move input
         """
-        return f"\n{current_player.value.upper()}'s move (e.g., 'e2' to select, 'e4' to move): "
+        return _MOVE_PROMPTS[current_player]
     
     def render_error(self, message: str) -> str:
         """
@@ -314,6 +368,11 @@ class ChessDisplay:
         return f"\n{message}\n"
 
 
+# Shared display for the convenience function, created on first use so
+# importing the module stays cheap
+_DEFAULT_DISPLAY: Optional[ChessDisplay] = None
+
+
 def render_board(
     state: GameState,
     selected_square: Optional[Square] = None,
@@ -334,5 +393,7 @@ def render_board(
     
     Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 8.2, 8.3
     """
-    display = ChessDisplay()
-    return display.render_board(state, selected_square, legal_moves, game_result)
+    global _DEFAULT_DISPLAY
+    if _DEFAULT_DISPLAY is None:
+        _DEFAULT_DISPLAY = ChessDisplay()
+    return _DEFAULT_DISPLAY.render_board(state, selected_square, legal_moves, game_result)